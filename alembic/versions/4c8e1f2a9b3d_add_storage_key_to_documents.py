@@ -0,0 +1,34 @@
+"""add storage_key to documents
+
+Revision ID: 4c8e1f2a9b3d
+Revises: e1e840973c81
+Create Date: 2026-10-15 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8e1f2a9b3d'
+down_revision: Union[str, None] = 'e1e840973c81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('storage_key', sa.String(length=512), nullable=True))
+    op.create_index(op.f('ix_documents_storage_key'), 'documents', ['storage_key'], unique=False)
+    # Backfill with the key convention used before this column existed
+    op.execute("""
+        UPDATE documents
+        SET storage_key = id || '_' || filename
+        WHERE filename IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_documents_storage_key'), table_name='documents')
+    op.drop_column('documents', 'storage_key')
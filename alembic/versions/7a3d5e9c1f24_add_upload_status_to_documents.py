@@ -0,0 +1,28 @@
+"""add upload_status to documents
+
+Revision ID: 7a3d5e9c1f24
+Revises: 4c8e1f2a9b3d
+Create Date: 2026-10-15 11:03:27.294816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3d5e9c1f24'
+down_revision: Union[str, None] = '4c8e1f2a9b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('upload_status', sa.String(length=20), nullable=True))
+    # Existing rows were uploaded synchronously before being returned
+    op.execute("UPDATE documents SET upload_status = 'uploaded'")
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'upload_status')
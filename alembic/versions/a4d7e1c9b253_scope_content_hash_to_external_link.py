@@ -0,0 +1,30 @@
+"""scope content_hash to external_link
+
+Revision ID: a4d7e1c9b253
+Revises: f3a9c2e7b418
+Create Date: 2026-10-15 23:05:12.418306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7e1c9b253'
+down_revision: Union[str, None] = 'f3a9c2e7b418'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_documents_content_hash'), table_name='documents')
+    op.create_index(op.f('ix_documents_content_hash'), 'documents', ['content_hash'], unique=False)
+    op.create_index('uq_documents_external_link_content_hash', 'documents', ['external_link', 'content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_documents_external_link_content_hash', table_name='documents')
+    op.drop_index(op.f('ix_documents_content_hash'), table_name='documents')
+    op.create_index(op.f('ix_documents_content_hash'), 'documents', ['content_hash'], unique=True)
@@ -0,0 +1,26 @@
+"""add external_version to documents
+
+Revision ID: d5e1a7b3c960
+Revises: b82f4c6d0e17
+Create Date: 2026-10-15 15:21:56.108934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e1a7b3c960'
+down_revision: Union[str, None] = 'b82f4c6d0e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('external_version', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'external_version')
@@ -0,0 +1,59 @@
+"""make document content jsonb
+
+Revision ID: f3a9c2e7b418
+Revises: d5e1a7b3c960
+Create Date: 2026-10-15 17:02:41.553870
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c2e7b418'
+down_revision: Union[str, None] = 'd5e1a7b3c960'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _strip_nul(value):
+    """Copy of a JSON value with NUL characters removed from every string"""
+    if isinstance(value, str):
+        return value.replace('\x00', '')
+    if isinstance(value, dict):
+        return {_strip_nul(k): _strip_nul(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_strip_nul(v) for v in value]
+    return value
+
+
+def upgrade() -> None:
+    # JSONB cannot hold \u0000, which plain JSON accepted; clean those rows
+    # first or the cast below aborts
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, content::text FROM documents "
+        "WHERE strpos(content::text, '\\u0000') > 0"
+    )).all()
+    for document_id, content in rows:
+        bind.execute(
+            sa.text("UPDATE documents SET content = CAST(:content AS json) WHERE id = :id"),
+            {"id": document_id, "content": json.dumps(_strip_nul(json.loads(content)))},
+        )
+
+    op.execute("""
+        ALTER TABLE documents
+        ALTER COLUMN content TYPE JSONB
+        USING content::jsonb
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE documents
+        ALTER COLUMN content TYPE JSON
+        USING content::json
+    """)
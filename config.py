@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import List
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,6 +11,14 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "fastapi_db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+    DB_INSERT_PAGE_SIZE: int = 1000
+    DB_BATCH_PAGE_SIZE: int = 500
+    # Create missing tables at startup; for throwaway local databases only,
+    # real deployments are migrated with Alembic
+    AUTO_CREATE_TABLES: bool = False
 
     # MinIO settings
     MINIO_ENDPOINT: str = "localhost:9000"
@@ -15,11 +26,16 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = "minioadmin"
     MINIO_SECURE: bool = False
     MINIO_BUCKET_NAME: str = "fastapi-bucket"
+    MINIO_UPLOAD_CONCURRENCY: int = 16
 
     # Application settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Browser origins allowed to call the API, as a JSON list in the env;
+    # pin this in production
+    CORS_ORIGINS: List[str] = ["*"]
+    CORS_MAX_AGE: int = 86400
 
     # Environment
     ENVIRONMENT: str = "development"
@@ -29,6 +45,14 @@ class Settings(BaseSettings):
     JIRA_URL: str = "https://your-domain.atlassian.net"
     JIRA_USER: str = "your-email@example.com"
     JIRA_TOKEN: str = "your-jira-token"
+    JIRA_MAX_CONCURRENCY: int = 8
+    # Keep-alive connections (and in-flight requests) shared by all JIRA
+    # calls in the process; at least JIRA_MAX_CONCURRENCY
+    JIRA_POOL_MAXSIZE: int = 20
+    JIRA_TIMEOUT: float = 30
+    # Requests per second ceiling for JIRA calls; 0 leaves pacing to the
+    # server's rate-limit headers
+    JIRA_MAX_RPS: float = 0
 
     # Confluence settings
     CONFLUENCE_URL: str = "https://your-domain.atlassian.net"
@@ -48,4 +72,13 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built on first use"""
+    return Settings()
+
+
+# Module-level alias for import-time consumers (engine, MinIO client, CORS);
+# it is fixed once imported. Route handlers take
+# Depends(get_settings), which app.dependency_overrides can replace.
+settings = get_settings()
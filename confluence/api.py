@@ -1,20 +1,40 @@
+import hashlib
+
 from document.service import DocumentService
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database import get_db
 from models import Document
 from schemas import ConfluencePageRequest, ConfluencePageResponse
-from confluence_service import ConfluenceService
-from minio_client import upload_file_content, create_bucket_if_not_exists
+from confluence_service import ConfluenceService, PageNotModified
+from minio_client import create_bucket_if_not_exists
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+def _page_response(
+    document_id: int, content_data: dict, outcome: str, status: str = "pulled"
+):
+    """Build the /pull response for a stored page"""
+    return ConfluencePageResponse(
+        document_id=document_id,
+        status=status,
+        title=content_data['title'],
+        filename=content_data['filename'],
+        page_id=content_data['page_id'],
+        space_name=content_data['space_name'],
+        version=content_data['version'],
+        message=f"Successfully pulled Confluence page '{content_data['title']}' and {outcome} document {document_id}"
+    )
+
+
 @router.post("/pull", response_model=ConfluencePageResponse)
 def pull_confluence_page(
     request: ConfluencePageRequest, 
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -24,46 +44,94 @@ def pull_confluence_page(
         # Initialize Confluence service
         confluence_service = ConfluenceService()
         
+        # Latest version already pulled from this URL, if any
+        previous = (
+            db.query(Document.id, Document.filename, Document.external_version)
+            .filter(
+                Document.external_link == request.url,
+                Document.external_version.isnot(None),
+            )
+            .order_by(Document.id.desc())
+            .first()
+        )
+        
         # Fetch page data from Confluence
         logger.info(f"Fetching Confluence page from URL: {request.url}")
-        page_data = confluence_service.fetch_page_by_url(request.url)
+        try:
+            page_data = confluence_service.fetch_page_by_url(
+                request.url,
+                known_version=previous.external_version if previous else None,
+            )
+        except PageNotModified as e:
+            logger.info(f"Confluence page {e.page_id} not modified since document {previous.id}")
+            return ConfluencePageResponse(
+                document_id=previous.id,
+                status="unchanged",
+                filename=previous.filename,
+                page_id=e.page_id,
+                version=e.version,
+                message=f"Confluence page {e.page_id} is unchanged since document {previous.id}"
+            )
         
         # Extract content
         content_data = confluence_service.extract_page_content(page_data, request.url)
         
-        # Ensure bucket exists
-        create_bucket_if_not_exists()
-        
-        # Upload content to MinIO
-        logger.info(f"Uploading content to MinIO: {content_data['filename']}")
-        upload_success = upload_file_content(
-            content_data['content'], 
-            content_data['filename']
+        # Identical content was already pulled from this page, reuse that
+        # document
+        content_hash = hashlib.sha256(
+            content_data['content'].encode('utf-8')
+        ).hexdigest()
+        existing = (
+            db.query(Document.id)
+            .filter(
+                Document.external_link == request.url,
+                Document.content_hash == content_hash,
+            )
+            .first()
         )
-        
-        if not upload_success:
-            raise HTTPException(
-                status_code=500, 
-                detail="Failed to upload content to MinIO"
+        if existing:
+            logger.info(f"Confluence page unchanged, reusing document {existing.id}")
+            return _page_response(
+                existing.id, content_data, "already pulled as", "unchanged"
             )
         
+        # Ensure bucket exists
+        create_bucket_if_not_exists()
+        
+        # Content is uploaded to MinIO after the response is sent
         document_service = DocumentService(db)
-        document = document_service.create_document(Document(
-            content=content_data['json_content'],
-            filename=content_data['filename'],
-            bucket=request.bucket,
-            external_link=request.url
-        ))
+        try:
+            document = document_service.create_document(
+                Document(
+                    content=content_data['json_content'],
+                    filename=content_data['filename'],
+                    bucket=request.bucket,
+                    external_link=request.url,
+                    external_version=content_data['version'],
+                    content_hash=content_hash
+                ),
+                content_data['content'],
+                background_tasks,
+            )
+        except IntegrityError:
+            # A concurrent pull of the same page inserted it first
+            db.rollback()
+            existing = (
+                db.query(Document.id)
+                .filter(
+                    Document.external_link == request.url,
+                    Document.content_hash == content_hash,
+                )
+                .first()
+            )
+            if not existing:
+                raise
+            return _page_response(
+                existing.id, content_data, "already pulled as", "unchanged"
+            )
         logger.info(f"Successfully created document with ID: {document.id}")
         
-        return ConfluencePageResponse(
-            document_id=document.id,
-            title=content_data['title'],
-            filename=content_data['filename'],
-            page_id=content_data['page_id'],
-            space_name=content_data['space_name'],
-            message=f"Successfully pulled Confluence page '{content_data['title']}' and saved as document {document.id}"
-        )
+        return _page_response(document.id, content_data, "saved as")
         
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
@@ -1,25 +1,88 @@
+import logging
 import os
 import re
-from typing import Dict, Any, Optional
+import threading
+from html import escape
+from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse, parse_qs
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from atlassian import Confluence
-from config import settings
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# libxml2's HTML parser drops CDATA sections (Confluence code macros),
+# so they are turned into escaped text before parsing
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+_PAGE_ID_RE = re.compile(r'/pages/(\d+)')
+_TITLE_STRIP_RE = re.compile(r'[^\w\s-]')
+_TITLE_DASH_RE = re.compile(r'[-\s]+')
+# Any whitespace run spanning a line break: trims both lines, drops blanks
+_WS_COLLAPSE_RE = re.compile(r'\s*\n\s*')
+
+# Statuses on which the v2 REST API is treated as unavailable (Server/DC)
+_V2_UNAVAILABLE_STATUSES = (404, 410)
+# Maximum number of ids accepted by GET /api/v2/pages?id=...
+_V2_PAGES_BATCH_SIZE = 250
+
+
+class PageNotModified(Exception):
+    """Raised when a page's version matches the one already stored"""
+
+    def __init__(self, page_id: str, version: int):
+        super().__init__(f"Page {page_id} unchanged at version {version}")
+        self.page_id = page_id
+        self.version = version
 
 
 class ConfluenceService:
-    def __init__(self):
-        self._confluence = None
+    # Shared by every instance so page pulls reuse pooled keep-alive
+    # connections instead of paying TCP + TLS setup per request
+    _session: Optional[Session] = None
+    _confluence: Optional[Confluence] = None
+    _space_names: Dict[str, str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _http_session(cls) -> Session:
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    session = Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=50,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.3,
+                            status_forcelist=[429, 502, 503, 504],
+                        ),
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+
+        return cls._session
 
     def _client(self) -> Confluence:
-        if self._confluence is None:
-            self._confluence = Confluence(
-                url=settings.CONFLUENCE_URL,
-                username=settings.CONFLUENCE_USER,
-                password=settings.CONFLUENCE_TOKEN
-            )
+        cls = type(self)
+        if cls._confluence is None:
+            session = cls._http_session()
+            settings = get_settings()
+            with cls._lock:
+                if cls._confluence is None:
+                    cls._confluence = Confluence(
+                        url=settings.CONFLUENCE_URL,
+                        username=settings.CONFLUENCE_USER,
+                        password=settings.CONFLUENCE_TOKEN,
+                        session=session,
+                    )
     
-        return self._confluence
+        return cls._confluence
 
     def extract_page_id_from_url(self, url: str) -> Optional[str]:
         """Extract page ID from Confluence URL"""
@@ -38,7 +101,7 @@ class ConfluenceService:
                     return query_params['pageId'][0]
             
             # Check for pages/ID pattern in path
-            path_match = re.search(r'/pages/(\d+)', parsed_url.path)
+            path_match = _PAGE_ID_RE.search(parsed_url.path)
             if path_match:
                 return path_match.group(1)
             
@@ -49,43 +112,158 @@ class ConfluenceService:
 
     def html_to_text(self, html: str) -> str:
         """Convert HTML content to plain text"""
-        soup = BeautifulSoup(html, "html.parser")
+        html = _CDATA_RE.sub(lambda m: escape(m.group(1)), html)
+        try:
+            root = lxml.html.fromstring(html)
+        except etree.ParserError:
+            # Empty or whitespace/comment-only document
+            return ""
         
-        # Remove script and style elements
-        for s in soup(["script", "style"]):
-            s.decompose()
+        # Remove script, style and comment nodes; the text after each one
+        # stays a separate line instead of running into the text before it
+        for element in root.iter("script", "style", etree.Comment):
+            element.tail = "\n" + (element.tail or "")
+        etree.strip_elements(
+            root, "script", "style", etree.Comment, with_tail=False
+        )
         
         # Get text content
-        text = soup.get_text(separator="\n")
+        text = "\n".join(root.itertext())
         
         # Clean up whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        return "\n".join(lines)
+        return _WS_COLLAPSE_RE.sub("\n", text).strip()
+
+    def fetch_page(
+        self, page_id_or_url: str, known_version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fetch a page by ID, or by URL when no ID has been parsed yet"""
+        if isinstance(page_id_or_url, str) and page_id_or_url.isdigit():
+            return self.fetch_page_by_id(page_id_or_url, known_version)
+        
+        return self.fetch_page_by_url(page_id_or_url, known_version)
 
-    def fetch_page_by_url(self, url: str) -> Dict[str, Any]:
+    def fetch_page_by_url(
+        self, url: str, known_version: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Fetch Confluence page content by URL"""
         page_id = self.extract_page_id_from_url(url)
         if not page_id:
             raise ValueError(f"Could not extract page ID from URL: {url}")
         
-        return self.fetch_page_by_id(page_id)
+        return self.fetch_page_by_id(page_id, known_version)
+
+    def _v2_url(self, path: str) -> str:
+        base_url = get_settings().CONFLUENCE_URL.rstrip("/")
+        if not base_url.endswith("/wiki"):
+            base_url += "/wiki"
+        return f"{base_url}/api/v2{path}"
+
+    def _v2_get(self, path: str, params: Dict[str, Any] = None):
+        settings = get_settings()
+        return self._http_session().get(
+            self._v2_url(path),
+            params=params,
+            auth=(settings.CONFLUENCE_USER, settings.CONFLUENCE_TOKEN),
+            timeout=30,
+        )
+
+    def fetch_page_by_id(
+        self, page_id: str, known_version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fetch Confluence page content by ID
 
-    def fetch_page_by_id(self, page_id: str) -> Dict[str, Any]:
-        """Fetch Confluence page content by ID"""
+        Raises PageNotModified instead when the page is still at known_version.
+        """
         try:
-            c = self._client()
-            page = c.get_page_by_id(
-                page_id, 
-                expand="body.storage,version,space"
+            # A body-less version lookup is much cheaper than the full page
+            if known_version is not None:
+                version = self.fetch_page_version(page_id)
+                if version == known_version:
+                    raise PageNotModified(page_id, version)
+
+            response = self._v2_get(
+                f"/pages/{page_id}", params={"body-format": "storage"}
             )
-            
-            if not page:
-                raise ValueError(f"Page with ID {page_id} not found or accessible")
-            
-            return page
+            if response.status_code in _V2_UNAVAILABLE_STATUSES:
+                return self._fetch_page_by_id_v1(page_id)
+
+            response.raise_for_status()
+            return response.json()
+        except PageNotModified:
+            raise
         except Exception as e:
             raise Exception(f"Error fetching page {page_id}: {str(e)}")
 
+    def fetch_page_version(self, page_id: str) -> Optional[int]:
+        """Fetch only the current version number of a page"""
+        response = self._v2_get(f"/pages/{page_id}")
+        if response.status_code in _V2_UNAVAILABLE_STATUSES:
+            page = self._client().get_page_by_id(page_id, expand="version")
+        else:
+            response.raise_for_status()
+            page = response.json()
+
+        return (page or {}).get("version", {}).get("number")
+
+    def _fetch_page_by_id_v1(self, page_id: str) -> Dict[str, Any]:
+        """Fetch a page through the legacy v1 content API"""
+        c = self._client()
+        page = c.get_page_by_id(
+            page_id, 
+            expand="body.storage,version,space"
+        )
+        
+        if not page:
+            raise ValueError(f"Page with ID {page_id} not found or accessible")
+        
+        return page
+
+    def fetch_pages_by_ids(self, page_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several Confluence pages with batched v2 requests"""
+        pages = []
+        for start in range(0, len(page_ids), _V2_PAGES_BATCH_SIZE):
+            chunk = page_ids[start:start + _V2_PAGES_BATCH_SIZE]
+            try:
+                response = self._v2_get(
+                    "/pages",
+                    params={
+                        "id": ",".join(str(page_id) for page_id in chunk),
+                        "body-format": "storage",
+                        "limit": _V2_PAGES_BATCH_SIZE,
+                    },
+                )
+                if response.status_code in _V2_UNAVAILABLE_STATUSES:
+                    pages.extend(
+                        self._fetch_page_by_id_v1(page_id) for page_id in chunk
+                    )
+                    continue
+
+                response.raise_for_status()
+                pages.extend(response.json().get("results", []))
+            except Exception as e:
+                raise Exception(f"Error fetching pages {chunk}: {str(e)}")
+
+        return pages
+
+    def _space_name(self, space_id: Optional[str]) -> str:
+        """Resolve a v2 spaceId to its name, cached per process"""
+        if not space_id:
+            return "Unknown Space"
+
+        cls = type(self)
+        if space_id not in cls._space_names:
+            try:
+                response = self._v2_get(f"/spaces/{space_id}")
+                response.raise_for_status()
+                cls._space_names[space_id] = response.json().get(
+                    "name", "Unknown Space"
+                )
+            except Exception as e:
+                logger.warning(f"Error fetching space {space_id}: {e}")
+                return "Unknown Space"
+
+        return cls._space_names[space_id]
+
     def extract_page_content(self, page_data: Dict[str, Any], url: str = None) -> Dict[str, str]:
         """Extract and process page content"""
         title = page_data.get("title", "Untitled")
@@ -97,13 +275,16 @@ class ConfluenceService:
         # Convert to plain text
         text_content = self.html_to_text(body_html)
         
-        # Get space information
-        space_info = page_data.get("space", {})
-        space_name = space_info.get("name", "Unknown Space")
+        # Get space information (v1 embeds the space, v2 only its id)
+        space_info = page_data.get("space")
+        if space_info:
+            space_name = space_info.get("name", "Unknown Space")
+        else:
+            space_name = self._space_name(page_data.get("spaceId"))
         
         # Create filename
-        safe_title = re.sub(r'[^\w\s-]', '', title).strip()
-        safe_title = re.sub(r'[-\s]+', '-', safe_title)
+        safe_title = _TITLE_STRIP_RE.sub('', title).strip()
+        safe_title = _TITLE_DASH_RE.sub('-', safe_title)
         filename = f"confluence-{page_id}-{safe_title}.txt"
         
         return {
@@ -112,6 +293,7 @@ class ConfluenceService:
             "filename": filename,
             "page_id": page_id,
             "space_name": space_name,
+            "version": page_data.get("version", {}).get("number"),
             "html_content": body_html,
             "json_content": {
                 "page_id": page_id,
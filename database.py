@@ -1,3 +1,4 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -6,8 +7,46 @@ from config import settings
 # Database URL
 SQLALCHEMY_DATABASE_URL = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
 
-# Create engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+def _strip_nul(value):
+    """Copy of a JSON value with NUL characters removed from every string"""
+    if isinstance(value, str):
+        return value.replace("\x00", "")
+    if isinstance(value, dict):
+        return {_strip_nul(k): _strip_nul(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_strip_nul(v) for v in value]
+    return value
+
+
+def json_serializer(value) -> str:
+    """Encode JSON/JSONB column values with orjson instead of json.dumps"""
+    encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    # JSONB rejects \u0000, which extracted file text and pulled pages can
+    # contain; only values that (may) have one pay for the cleanup
+    if b"\\u0000" in encoded:
+        encoded = orjson.dumps(
+            _strip_nul(value), option=orjson.OPT_NON_STR_KEYS
+        )
+    return encoded.decode("utf-8")
+
+
+# Create engine; pre-ping drops connections Postgres closed while idle and
+# LIFO checkout keeps a small set of warm connections in use
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    # Pack executemany INSERTs into multi-row VALUES pages and run
+    # executemany UPDATE/DELETE through psycopg2's execute_batch
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=settings.DB_INSERT_PAGE_SIZE,
+    executemany_batch_page_size=settings.DB_BATCH_PAGE_SIZE,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -2,12 +2,21 @@
 Comprehensive Document API for handling Confluence, JIRA, and file imports
 """
 
-import json
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    UploadFile,
+    File,
+    Form,
+    Query,
+)
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -17,6 +26,7 @@ from schemas import (
     DocumentImportRequest,
     DocumentImportResponse,
     DocumentResponse,
+    DocumentSummary,
     ConfluencePageRequest,
     JiraIssueRequest,
 )
@@ -27,8 +37,8 @@ from minio_client import (
 )
 from services.url_detector import URLDetector, SourceType
 from services.file_processor import FileProcessor
-from document.service import DocumentService
-from config import settings
+from document.service import DocumentService, upload_documents_content
+from config import Settings, get_settings
 
 # Import services
 try:
@@ -44,6 +54,7 @@ router = APIRouter()
 
 @router.post("/import", response_model=DocumentImportResponse)
 async def import_document(
+    background_tasks: BackgroundTasks,
     source: str = Form(...),
     url: Optional[str] = Form(None),
     filename: Optional[str] = Form(None),
@@ -52,6 +63,7 @@ async def import_document(
     file: Optional[UploadFile] = File(None),
     project_id: Optional[int] = Form(None),
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     """
     Comprehensive document import endpoint that handles:
@@ -66,17 +78,35 @@ async def import_document(
 
         if source == "url" and url:
             return await _handle_url_import(
-                source, url, include_subtasks, project_id, db
+                source,
+                url,
+                include_subtasks,
+                project_id,
+                db,
+                background_tasks,
+                settings,
             )
 
         elif source == "file" and file:
             return await _handle_file_import(
-                source, file, filename, project_id, db
+                source,
+                file,
+                filename,
+                project_id,
+                db,
+                background_tasks,
+                settings,
             )
 
         elif source == "content" and content:
             return await _handle_content_import(
-                source, content, filename, project_id, db
+                source,
+                content,
+                filename,
+                project_id,
+                db,
+                background_tasks,
+                settings,
             )
 
         else:
@@ -85,6 +115,8 @@ async def import_document(
                 detail="Invalid source type or missing required parameters",
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error importing document: {str(e)}")
 
@@ -99,8 +131,12 @@ async def _handle_url_import(
     include_subtasks: bool,
     project_id: Optional[int],
     db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+    settings: Optional[Settings] = None,
 ) -> DocumentImportResponse:
     """Handle URL-based imports (Confluence/JIRA)"""
+    if settings is None:
+        settings = get_settings()
 
     # Detect URL type
     url_info = URLDetector.parse_url(url)
@@ -119,7 +155,10 @@ async def _handle_url_import(
             )
 
         confluence_service = ConfluenceService()
-        page_data = confluence_service.fetch_page_by_url(url)
+        # URLDetector already extracted the page ID for most URL formats
+        page_data = confluence_service.fetch_page(
+            url_info["identifier"] or url
+        )
         content_data = confluence_service.extract_page_content(page_data, url)
 
         # Create document using DocumentService
@@ -129,13 +168,14 @@ async def _handle_url_import(
             filename=content_data["filename"],
             bucket=settings.MINIO_BUCKET_NAME,
             external_link=url,
+            external_version=content_data["version"],
             doc_type=DocumentType.CONFLUENCE,
             project_id=project_id,
             source=source,
         )
 
         document = document_service.create_document(
-            document, content_data["content"]
+            document, content_data["content"], background_tasks
         )
 
         return DocumentImportResponse(
@@ -173,19 +213,81 @@ async def _handle_url_import(
                     detail="Could not extract project key from board URL",
                 )
 
-            content_data = jira_service.fetch_board_issues(
-                project_key, board_id
+            content_data = await asyncio.to_thread(
+                jira_service.fetch_board_issues, project_key, board_id
+            )
+            if not content_data["issues"]:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No issues found for JIRA board: {project_key}",
+                )
+
+            # One document per issue, inserted in a single transaction
+            document_service = DocumentService(db)
+            documents = document_service.create_documents(
+                [
+                    Document(
+                        content=issue["content"],
+                        filename=issue["filename"],
+                        bucket=settings.MINIO_BUCKET_NAME,
+                        external_link=issue["url"],
+                        doc_type=DocumentType.JIRA,
+                        project_id=project_id,
+                        source=source,
+                    )
+                    for issue in content_data["issues"]
+                ]
+            )
+
+            uploads = [
+                (
+                    document.id,
+                    document.storage_key,
+                    issue["content"],
+                    "application/octet-stream",
+                )
+                for document, issue in zip(documents, content_data["issues"])
+            ]
+            if background_tasks is not None:
+                background_tasks.add_task(upload_documents_content, uploads)
+            else:
+                await upload_documents_content(uploads)
+
+            return DocumentImportResponse(
+                document_id=documents[0].id,
+                source="jira",
+                title=content_data["title"],
+                filename=content_data["filename"],
+                bucket=settings.MINIO_BUCKET_NAME,
+                external_link=url,
+                message=f"Successfully imported JIRA board: {content_data['project_key']} ({content_data['total_issues']} issues)",
+                metadata={
+                    "project_key": content_data["project_key"],
+                    "board_id": content_data.get("board_id"),
+                    "total_issues": content_data["total_issues"],
+                    "document_ids": [document.id for document in documents],
+                },
             )
         else:
             # Handle single issue import
-            issue_data = jira_service.fetch_issue_by_url(url)
+            issue_key = url_info["identifier"]
+            if not issue_key:
+                raise ValueError(
+                    f"Could not extract issue key from URL: {url}"
+                )
 
-            # Fetch subtasks if requested
-            subtasks = []
+            # Fetch the issue and its subtasks concurrently
+            fetches = [
+                asyncio.to_thread(jira_service.fetch_issue_by_key, issue_key)
+            ]
             if include_subtasks:
-                issue_key = jira_service.extract_issue_key_from_url(url)
-                if issue_key:
-                    subtasks = jira_service.fetch_issue_subtasks(issue_key)
+                fetches.append(
+                    asyncio.to_thread(
+                        jira_service.fetch_issue_subtasks, issue_key
+                    )
+                )
+            issue_data, *subtask_results = await asyncio.gather(*fetches)
+            subtasks = subtask_results[0] if subtask_results else []
 
             content_data = jira_service.format_issue_content(
                 issue_data, subtasks
@@ -204,41 +306,22 @@ async def _handle_url_import(
         )
 
         document = document_service.create_document(
-            document, content_data["content"]
+            document, content_data["content"], background_tasks
         )
 
-        # Create appropriate response based on import type
-        if url_info.get("url_type") == "board":
-            return DocumentImportResponse(
-                document_id=document.id,
-                source="jira",
-                title=content_data["title"],
-                filename=content_data["filename"],
-                bucket=settings.MINIO_BUCKET_NAME,
-                external_link=url,
-                message=f"Successfully imported JIRA board: {content_data['project_key']} ({content_data['total_issues']} issues)",
-                metadata={
-                    "project_key": content_data["project_key"],
-                    "board_id": content_data.get("board_id"),
-                    "total_issues": content_data["total_issues"],
-                },
-            )
-        else:
-            return DocumentImportResponse(
-                document_id=document.id,
-                source="jira",
-                title=content_data["title"],
-                filename=content_data["filename"],
-                bucket=settings.MINIO_BUCKET_NAME,
-                external_link=url,
-                message=f"Successfully imported JIRA issue: {content_data['issue_key']}",
-                metadata={
-                    "issue_key": content_data["issue_key"],
-                    "project_name": content_data.get(
-                        "project_name", "Unknown"
-                    ),
-                },
-            )
+        return DocumentImportResponse(
+            document_id=document.id,
+            source="jira",
+            title=content_data["title"],
+            filename=content_data["filename"],
+            bucket=settings.MINIO_BUCKET_NAME,
+            external_link=url,
+            message=f"Successfully imported JIRA issue: {content_data['issue_key']}",
+            metadata={
+                "issue_key": content_data["issue_key"],
+                "project_name": content_data.get("project_name", "Unknown"),
+            },
+        )
 
     else:
         raise HTTPException(status_code=400, detail="Unsupported URL type")
@@ -250,8 +333,12 @@ async def _handle_file_import(
     filename: Optional[str],
     project_id: Optional[int],
     db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+    settings: Optional[Settings] = None,
 ) -> DocumentImportResponse:
     """Handle file upload imports"""
+    if settings is None:
+        settings = get_settings()
 
     # Validate file type
     if not FileProcessor.is_supported_file_type(file.content_type):
@@ -271,6 +358,7 @@ async def _handle_file_import(
 
     # Create metadata
     metadata = FileProcessor.create_file_metadata(file, content)
+    metadata["sha256"], metadata["size"] = await FileProcessor.file_digest(file)
 
     # Format content for storage
     formatted_content = FileProcessor.format_file_content(
@@ -289,7 +377,9 @@ async def _handle_file_import(
         source=source,
     )
 
-    document = document_service.create_document(document, formatted_content)
+    document = document_service.create_document(
+        document, formatted_content, background_tasks
+    )
 
     return DocumentImportResponse(
         document_id=document.id,
@@ -310,8 +400,12 @@ async def _handle_content_import(
     filename: Optional[str],
     project_id: Optional[int],
     db: Session,
+    background_tasks: Optional[BackgroundTasks] = None,
+    settings: Optional[Settings] = None,
 ) -> DocumentImportResponse:
     """Handle direct content imports"""
+    if settings is None:
+        settings = get_settings()
 
     if not filename:
         filename = f"content-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.txt"
@@ -337,7 +431,9 @@ async def _handle_content_import(
         source=source,
     )
 
-    document = document_service.create_document(document, content)
+    document = document_service.create_document(
+        document, content, background_tasks
+    )
 
     return DocumentImportResponse(
         document_id=document.id,
@@ -353,7 +449,11 @@ async def _handle_content_import(
 
 
 @router.post("/", response_model=DocumentResponse)
-def create_document(document: DocumentCreate, db: Session = Depends(get_db)):
+def create_document(
+    document: DocumentCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """Create a document with direct content (legacy endpoint)"""
     try:
         # Create document using DocumentService
@@ -372,7 +472,9 @@ def create_document(document: DocumentCreate, db: Session = Depends(get_db)):
             if not isinstance(document.content, str)
             else document.content
         )
-        db_document = document_service.create_document(db_document, content)
+        db_document = document_service.create_document(
+            db_document, content, background_tasks
+        )
         return db_document
 
     except Exception as e:
@@ -382,12 +484,16 @@ def create_document(document: DocumentCreate, db: Session = Depends(get_db)):
         )
 
 
-@router.get("/", response_model=list[DocumentResponse])
-def get_documents(db: Session = Depends(get_db)):
-    """Get all documents"""
+@router.get("/", response_model=list[DocumentSummary])
+def get_documents(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Get a page of documents (metadata only, newest first)"""
     try:
         document_service = DocumentService(db)
-        documents = document_service.get_documents()
+        documents = document_service.get_documents(limit, offset)
         return documents
     except Exception as e:
         logger.error(f"Error fetching documents: {str(e)}")
@@ -423,7 +529,7 @@ def delete_document(document_id: int, db: Session = Depends(get_db)):
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
 
-        document_service.delete_document(document_id)
+        document_service.delete_document(document)
         return {"message": f"Document {document_id} deleted successfully"}
     except HTTPException:
         raise
@@ -443,7 +549,7 @@ def download_document(document_id: int, db: Session = Depends(get_db)):
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
 
-        content = document_service.download_document(document_id)
+        content = document_service.download_document(document)
         return {"content": content, "filename": document.filename}
     except HTTPException:
         raise
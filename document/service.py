@@ -1,40 +1,139 @@
-from database import get_db
+import asyncio
+from typing import List, Optional, Tuple, Union
+
+import orjson
+from fastapi import BackgroundTasks
+
+from config import get_settings
+from database import SessionLocal, get_db
 from models import Document
-from minio_client import download_file, upload_file_content
-from sqlalchemy.orm import Session
+from minio_client import download_file, upload_executor, upload_file_content
+from sqlalchemy.orm import Session, defer
+
+
+def dump_json(content) -> bytes:
+    """Serialize document content to JSON bytes, indented only in debug"""
+    return orjson.dumps(
+        content, option=orjson.OPT_INDENT_2 if get_settings().DEBUG else 0
+    )
+
+
+def build_storage_key(document: Document) -> str:
+    """MinIO object name for a document that already has an ID"""
+    return f"{document.id}_{document.filename}"
+
+
+def upload_document_content(
+    document_id: int,
+    storage_key: str,
+    content: Union[str, bytes],
+    content_type: str = "application/octet-stream",
+):
+    """Upload document content to MinIO and record the outcome on its row"""
+    uploaded = upload_file_content(content, storage_key, content_type)
+
+    # Runs after the response, so it cannot reuse the request session
+    db = SessionLocal()
+    try:
+        db.query(Document).filter(Document.id == document_id).update(
+            {Document.upload_status: "uploaded" if uploaded else "failed"},
+            synchronize_session=False,
+        )
+        db.commit()
+    finally:
+        db.close()
+    return uploaded
+
+
+async def upload_documents_content(uploads: List[Tuple]):
+    """Run several upload_document_content calls on the bounded upload pool"""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *[
+            loop.run_in_executor(upload_executor, upload_document_content, *upload)
+            for upload in uploads
+        ]
+    )
 
 
 class DocumentService:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_document(self, document: Document, minio_content: str = None):
+    def create_document(
+        self,
+        document: Document,
+        minio_content: str = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ):
+        document.upload_status = "pending"
         self.db.add(document)
+        # Flush to get the ID, then store the key in the same transaction
+        self.db.flush()
+        document.storage_key = build_storage_key(document)
         self.db.commit()
         self.db.refresh(document)
         
         # Use provided content for MinIO or fallback to JSON dump
         if minio_content is not None:
-            content = minio_content
+            content, content_type = minio_content, "application/octet-stream"
         else:
-            import json
-            content = json.dumps(document.content, indent=2)
-        
-        upload_file_content(content, str(document.id) + "_" + document.filename)
+            content, content_type = dump_json(document.content), "application/json"
+
+        # The row is committed, so the upload can finish after the response
+        if background_tasks is not None:
+            background_tasks.add_task(
+                upload_document_content,
+                document.id,
+                document.storage_key,
+                content,
+                content_type,
+            )
+        else:
+            uploaded = upload_file_content(
+                content, document.storage_key, content_type
+            )
+            document.upload_status = "uploaded" if uploaded else "failed"
+            self.db.commit()
+            self.db.refresh(document)
         return document
     
+    def create_documents(self, documents: List[Document]):
+        """Insert documents in one round trip; content is uploaded by the caller"""
+        for document in documents:
+            document.upload_status = "pending"
+        self.db.bulk_save_objects(documents, return_defaults=True)
+        # Keys depend on the generated IDs, so they are set in a second statement
+        self.db.bulk_update_mappings(
+            Document,
+            [
+                {"id": document.id, "storage_key": build_storage_key(document)}
+                for document in documents
+            ],
+        )
+        self.db.commit()
+        for document in documents:
+            document.storage_key = build_storage_key(document)
+        return documents
+
     def get_document(self, document_id: int):  #return the document
-        return self.db.query(Document).filter(Document.id == document_id).first()
+        return self.db.get(Document, document_id)
     
-    def delete_document(self, document_id: int):  #delete the document
-        document = self.get_document(document_id)
+    def delete_document(self, document: Document):  #delete the document
         self.db.delete(document)
         self.db.commit()
         return True
     
-    def get_documents(self):
-        return self.db.query(Document).all()
+    def get_documents(self, limit: int = 50, offset: int = 0):
+        # Listings only need metadata, so leave the content blob unloaded
+        return (
+            self.db.query(Document)
+            .options(defer(Document.content))
+            .order_by(Document.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
 
-    def download_document(self, document_id: int):  #return the content of the document
-        document = self.get_document(document_id)
-        return download_file(str(document.id) + "_" + document.filename)
\ No newline at end of file
+    def download_document(self, document: Document):  #return the content of the document
+        return download_file(document.storage_key)
\ No newline at end of file
@@ -3,14 +3,20 @@ Google Calendar integration service for meeting scheduling
 """
 
 import os
-import json
+import re
+import threading
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+import orjson
+import google_auth_httplib2
+import httplib2
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,8 +24,117 @@ logger = logging.getLogger(__name__)
 # If modifying these scopes, delete the file token.json.
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Event text and reminder settings shared by every StandIn event
+SUMMARY_PREFIX = "[StandIn] "
+DESCRIPTION_PREFIX = "📅 Scheduled by StandIn Meeting Scheduler\n\n"
+REMINDERS = {
+    "useDefault": False,
+    "overrides": [
+        {"method": "email", "minutes": 24 * 60},  # 1 day before
+        {"method": "popup", "minutes": 30},  # 30 minutes before
+    ],
+}
+
+# Maximum number of calls Google accepts in one batch request
+BATCH_LIMIT = 50
+
+# Socket timeout (seconds) for Calendar API calls
+HTTP_TIMEOUT = int(os.getenv("GOOGLE_API_TIMEOUT", "30"))
+
+
+def authorized_http(credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """
+    Build the transport for a Calendar service
+
+    httplib2 keeps the connection to each host open, so every call made
+    through one service reuses the same TLS connection.
+    """
+    return google_auth_httplib2.AuthorizedHttp(
+        credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT)
+    )
+
+
+# orjson writes UTF-8, but googleapiclient needs ASCII request bodies: they
+# are sent as str and measured with len() when packed into batch requests
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 + (code >> 10):04x}\\u{0xDC00 + (code & 0x3FF):04x}"
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies and decodes responses with orjson"""
+
+    def serialize(self, body_value):
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+        body = orjson.dumps(body_value).decode("utf-8")
+        if body.isascii():
+            return body
+        return _NON_ASCII_RE.sub(_escape_non_ascii, body)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+@lru_cache(maxsize=1)
+def calendar_discovery_doc() -> Dict[str, Any]:
+    """Calendar v3 discovery document shipped with googleapiclient, parsed once"""
+    return orjson.loads(discovery_cache.get_static_doc("calendar", "v3"))
+
+
+def build_calendar_service(credentials):
+    """Build a Calendar v3 service without fetching or re-parsing discovery"""
+    return build_from_document(
+        calendar_discovery_doc(),
+        http=authorized_http(credentials),
+        model=OrjsonModel(),
+    )
+
+
+def execute_batch(service, requests: List[Any]) -> List[Tuple[Any, Any]]:
+    """
+    Execute API requests through the batch endpoint, up to BATCH_LIMIT
+    calls per HTTP request
+
+    Returns:
+        list: (response, exception) per request, in input order
+    """
+    results: List[Tuple[Any, Any]] = [(None, None)] * len(requests)
+
+    def callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    for start in range(0, len(requests), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=callback)
+        for index in range(start, min(start + BATCH_LIMIT, len(requests))):
+            batch.add(requests[index], request_id=str(index))
+        batch.execute()
+
+    return results
+
 
 class GoogleCalendarService:
+    # Authenticated services shared by every instance. httplib2 connections
+    # are not thread-safe, so each worker thread gets its own service.
+    _services: Dict[Tuple[str, str, int], Any] = {}
+    _lock = threading.Lock()
+
     def __init__(self):
         self.service = None
         self.credentials_file = os.getenv(
@@ -29,6 +144,21 @@ class GoogleCalendarService:
 
     def authenticate(self) -> bool:
         """Authenticate with Google Calendar API"""
+        key = (self.token_file, self.credentials_file, threading.get_ident())
+        self.service = self._services.get(key)
+        if self.service is not None:
+            return True
+
+        # Serialize first-time setup so concurrent callers do not all
+        # refresh the token or start the login flow
+        with self._lock:
+            self.service = self._services.get(key)
+            if self.service is None and self._authenticate():
+                self._services[key] = self.service
+        return self.service is not None
+
+    def _authenticate(self) -> bool:
+        """Load, refresh or obtain credentials and build the service"""
         creds = None
 
         # The file token.json stores the user's access and refresh tokens.
@@ -38,6 +168,7 @@ class GoogleCalendarService:
             )
 
         # If there are no (valid) credentials available, let the user log in.
+        # The token file is only rewritten when the credentials changed.
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
@@ -52,6 +183,9 @@ class GoogleCalendarService:
                     )
                     return False
 
+                # Only needed for the interactive first-time login
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 try:
                     flow = InstalledAppFlow.from_client_secrets_file(
                         self.credentials_file, SCOPES
@@ -61,21 +195,24 @@ class GoogleCalendarService:
                     logger.error(f"Failed to authenticate: {e}")
                     return False
 
-            # Save the credentials for the next run
+            # Save the credentials for the next run; write a temp file and
+            # rename it so a crash mid-write cannot leave a truncated token
             try:
-                with open(self.token_file, "w") as token:
+                tmp_file = f"{self.token_file}.tmp"
+                with open(tmp_file, "w") as token:
                     token.write(creds.to_json())
+                os.replace(tmp_file, self.token_file)
             except Exception as e:
                 logger.error(f"Failed to save token: {e}")
 
         try:
-            self.service = build("calendar", "v3", credentials=creds)
+            self.service = build_calendar_service(creds)
             return True
         except Exception as e:
             logger.error(f"Failed to build calendar service: {e}")
             return False
 
-    def create_event(
+    def _event_body(
         self,
         title: str,
         description: str,
@@ -83,18 +220,8 @@ class GoogleCalendarService:
         end_time: datetime,
         attendees: List[str],
         meeting_link: Optional[str] = None,
-        calendar_id: str = "primary",
-    ) -> Optional[str]:
-        """
-        Create a Google Calendar event
-
-        Returns:
-            str: Google Calendar event ID if successful, None otherwise
-        """
-        if not self.service:
-            if not self.authenticate():
-                return None
-
+    ) -> Optional[Dict[str, Any]]:
+        """Build the request body for a new event, None if times are invalid"""
         # Ensure datetime objects have timezone info
         if start_time.tzinfo is None:
             start_time = start_time.replace(tzinfo=timezone.utc)
@@ -115,8 +242,8 @@ class GoogleCalendarService:
 
         # Prepare event data
         event_data = {
-            "summary": f"[StandIn] {title}",
-            "description": f"📅 Scheduled by StandIn Meeting Scheduler\n\n{description}",
+            "summary": SUMMARY_PREFIX + title,
+            "description": DESCRIPTION_PREFIX + description,
             "start": {
                 "dateTime": start_time.isoformat(),
                 "timeZone": "UTC",
@@ -126,13 +253,7 @@ class GoogleCalendarService:
                 "timeZone": "UTC",
             },
             "attendees": [{"email": email} for email in attendees],
-            "reminders": {
-                "useDefault": False,
-                "overrides": [
-                    {"method": "email", "minutes": 24 * 60},  # 1 day before
-                    {"method": "popup", "minutes": 30},  # 30 minutes before
-                ],
-            },
+            "reminders": REMINDERS,
         }
 
         # Add meeting link if provided
@@ -147,13 +268,42 @@ class GoogleCalendarService:
             #     }
             # }
 
+        return event_data
+
+    def create_event(
+        self,
+        title: str,
+        description: str,
+        start_time: datetime,
+        end_time: datetime,
+        attendees: List[str],
+        meeting_link: Optional[str] = None,
+        calendar_id: str = "primary",
+        send_updates: str = "externalOnly",
+    ) -> Optional[str]:
+        """
+        Create a Google Calendar event
+
+        Returns:
+            str: Google Calendar event ID if successful, None otherwise
+        """
+        if not self.service:
+            if not self.authenticate():
+                return None
+
+        event_data = self._event_body(
+            title, description, start_time, end_time, attendees, meeting_link
+        )
+        if event_data is None:
+            return None
+
         try:
             event = (
                 self.service.events()
                 .insert(
                     calendarId=calendar_id,
                     body=event_data,
-                    sendUpdates="all",  # Send invitations to all attendees
+                    sendUpdates=send_updates,
                 )
                 .execute()
             )
@@ -168,6 +318,58 @@ class GoogleCalendarService:
             logger.error(f"Failed to create event: {e}")
             return None
 
+    def create_events_bulk(
+        self,
+        events: List[Dict[str, Any]],
+        calendar_id: str = "primary",
+        send_updates: str = "externalOnly",
+    ) -> List[Optional[str]]:
+        """
+        Create several events with batched requests
+
+        Args:
+            events: create_event keyword arguments except calendar_id
+                and send_updates, one dict per event
+
+        Returns:
+            list: Google Calendar event ID per input event, None on failure
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [None] * len(events)
+
+        bodies = [self._event_body(**event) for event in events]
+        requests = [
+            self.service.events().insert(
+                calendarId=calendar_id, body=body, sendUpdates=send_updates
+            )
+            for body in bodies
+            if body is not None
+        ]
+
+        try:
+            results = iter(execute_batch(self.service, requests))
+        except Exception as e:
+            logger.error(f"Failed to create events: {e}")
+            return [None] * len(events)
+
+        event_ids = []
+        for body in bodies:
+            if body is None:
+                event_ids.append(None)
+                continue
+            event, error = next(results)
+            if error is not None:
+                logger.error(f"An error occurred: {error}")
+                event_ids.append(None)
+            else:
+                event_ids.append(event.get("id"))
+
+        logger.info(
+            f"Created {sum(1 for e in event_ids if e)} of {len(events)} events"
+        )
+        return event_ids
+
     def update_event(
         self,
         event_id: str,
@@ -178,57 +380,66 @@ class GoogleCalendarService:
         attendees: Optional[List[str]] = None,
         meeting_link: Optional[str] = None,
         calendar_id: str = "primary",
+        replace: bool = False,
+        send_updates: str = "externalOnly",
     ) -> bool:
-        """Update an existing Google Calendar event"""
+        """
+        Update an existing Google Calendar event
+
+        Only the given fields are sent (PATCH). With replace=True the event
+        is read and written back whole (GET + PUT) instead.
+        """
         if not self.service:
             if not self.authenticate():
                 return False
 
         try:
-            # Get the existing event
-            event = (
-                self.service.events()
-                .get(calendarId=calendar_id, eventId=event_id)
-                .execute()
-            )
-
-            # Update fields if provided
+            # Collect the fields to change
+            changes = {}
             if title:
-                event["summary"] = f"[StandIn] {title}"
+                changes["summary"] = SUMMARY_PREFIX + title
             if description:
-                event["description"] = (
-                    f"📅 Scheduled by StandIn Meeting Scheduler\n\n{description}"
-                )
+                changes["description"] = DESCRIPTION_PREFIX + description
             if start_time:
                 if start_time.tzinfo is None:
                     start_time = start_time.replace(tzinfo=timezone.utc)
-                event["start"] = {
+                changes["start"] = {
                     "dateTime": start_time.isoformat(),
                     "timeZone": "UTC",
                 }
             if end_time:
                 if end_time.tzinfo is None:
                     end_time = end_time.replace(tzinfo=timezone.utc)
-                event["end"] = {
+                changes["end"] = {
                     "dateTime": end_time.isoformat(),
                     "timeZone": "UTC",
                 }
             if attendees:
-                event["attendees"] = [{"email": email} for email in attendees]
+                changes["attendees"] = [{"email": email} for email in attendees]
             if meeting_link:
-                event["location"] = meeting_link
-
-            # Update the event
-            updated_event = (
-                self.service.events()
-                .update(
+                changes["location"] = meeting_link
+
+            events = self.service.events()
+            if replace:
+                # Get the existing event and update it as a whole
+                event = events.get(
+                    calendarId=calendar_id, eventId=event_id
+                ).execute()
+                event.update(changes)
+                request = events.update(
                     calendarId=calendar_id,
                     eventId=event_id,
                     body=event,
-                    sendUpdates="all",
+                    sendUpdates=send_updates,
                 )
-                .execute()
-            )
+            else:
+                request = events.patch(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    body=changes,
+                    sendUpdates=send_updates,
+                )
+            updated_event = request.execute()
 
             logger.info(f"Event updated: {updated_event.get('htmlLink')}")
             return True
@@ -241,7 +452,10 @@ class GoogleCalendarService:
             return False
 
     def delete_event(
-        self, event_id: str, calendar_id: str = "primary"
+        self,
+        event_id: str,
+        calendar_id: str = "primary",
+        send_updates: str = "externalOnly",
     ) -> bool:
         """Delete a Google Calendar event"""
         if not self.service:
@@ -250,7 +464,9 @@ class GoogleCalendarService:
 
         try:
             self.service.events().delete(
-                calendarId=calendar_id, eventId=event_id, sendUpdates="all"
+                calendarId=calendar_id,
+                eventId=event_id,
+                sendUpdates=send_updates,
             ).execute()
 
             logger.info(f"Event deleted: {event_id}")
@@ -263,6 +479,39 @@ class GoogleCalendarService:
             logger.error(f"Failed to delete event: {e}")
             return False
 
+    def delete_events_bulk(
+        self,
+        event_ids: List[str],
+        calendar_id: str = "primary",
+        send_updates: str = "externalOnly",
+    ) -> List[bool]:
+        """Delete several events with batched requests"""
+        if not self.service:
+            if not self.authenticate():
+                return [False] * len(event_ids)
+
+        requests = [
+            self.service.events().delete(
+                calendarId=calendar_id,
+                eventId=event_id,
+                sendUpdates=send_updates,
+            )
+            for event_id in event_ids
+        ]
+
+        try:
+            results = execute_batch(self.service, requests)
+        except Exception as e:
+            logger.error(f"Failed to delete events: {e}")
+            return [False] * len(event_ids)
+
+        deleted = []
+        for event_id, (_, error) in zip(event_ids, results):
+            if error is not None:
+                logger.error(f"Failed to delete event {event_id}: {error}")
+            deleted.append(error is None)
+        return deleted
+
     def get_event(
         self, event_id: str, calendar_id: str = "primary"
     ) -> Optional[Dict[str, Any]]:
@@ -4,18 +4,82 @@ This allows calendar invites to come from your organization email
 """
 
 import os
-import json
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from cachetools import LRUCache, cached
+from cachetools.keys import hashkey
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from google_calendar_service import (
+    DESCRIPTION_PREFIX,
+    REMINDERS,
+    SUMMARY_PREFIX,
+    build_calendar_service,
+    execute_batch,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+SCOPES = ('https://www.googleapis.com/auth/calendar',)
+
+# Delegated credentials per (key file, user); entries are evicted one at a
+# time when a user's token is rejected
+_DELEGATED_CREDENTIALS = LRUCache(maxsize=64)
+_DELEGATED_CREDENTIALS_LOCK = threading.Lock()
+
+# 403 reasons that mean the credentials themselves were refused; rate
+# limits and calendar permissions would fail the same way after a retry
+AUTH_ERROR_REASONS = frozenset({'authError', 'invalidCredentials'})
+
+
+@lru_cache(maxsize=1)
+def _service_account_credentials(service_account_file: str):
+    """Read and parse the service account key once per process"""
+    return service_account.Credentials.from_service_account_file(
+        service_account_file,
+        scopes=SCOPES
+    )
+
+
+@cached(_DELEGATED_CREDENTIALS, lock=_DELEGATED_CREDENTIALS_LOCK)
+def _delegated_credentials(service_account_file: str, delegated_user_email: str):
+    """Delegated credentials per user; each keeps its own cached access token"""
+    return _service_account_credentials(service_account_file).with_subject(
+        delegated_user_email
+    )
+
+
+def _is_auth_error(error: HttpError) -> bool:
+    """True for a 401, or a 403 whose reason says the credentials were refused"""
+    if error.resp.status == 401:
+        return True
+    if error.resp.status != 403 or not isinstance(error.error_details, list):
+        return False
+    return any(
+        isinstance(detail, dict) and detail.get('reason') in AUTH_ERROR_REASONS
+        for detail in error.error_details
+    )
+
+
+def _event_time(value: datetime) -> Dict[str, str]:
+    """Event start/end in UTC; naive datetimes are taken to be UTC already"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return {
+        'dateTime': value.astimezone(timezone.utc).isoformat(),
+        'timeZone': 'UTC',
+    }
+
 
 class GoogleCalendarServiceAccount:
+    # Authenticated services shared by every instance, one per worker thread
+    # because httplib2 connections are not thread-safe
+    _services: Dict[Tuple[str, str, int], Any] = {}
+    _lock = threading.Lock()
+
     def __init__(self, delegated_user_email: str = None):
         self.service = None
         self.delegated_user_email = delegated_user_email or os.getenv(
@@ -24,29 +88,43 @@ class GoogleCalendarServiceAccount:
         self.service_account_file = os.getenv(
             'GOOGLE_SERVICE_ACCOUNT_FILE', 'service-account-key.json'
         )
-        self.scopes = ['https://www.googleapis.com/auth/calendar']
+        self.scopes = list(SCOPES)
         
+    def _service_key(self) -> Tuple[str, str, int]:
+        return (
+            self.service_account_file,
+            self.delegated_user_email,
+            threading.get_ident()
+        )
+    
     def authenticate(self) -> bool:
         """Authenticate using service account with domain-wide delegation"""
+        key = self._service_key()
+        self.service = self._services.get(key)
+        if self.service is not None:
+            return True
+        
+        with self._lock:
+            self.service = self._services.get(key)
+            if self.service is None and self._authenticate():
+                self._services[key] = self.service
+        return self.service is not None
+    
+    def _authenticate(self) -> bool:
+        """Build a service from the cached delegated credentials"""
         try:
             if not os.path.exists(self.service_account_file):
                 logger.error(f"Service account file not found: {self.service_account_file}")
                 return False
             
-            # Load service account credentials
-            credentials = service_account.Credentials.from_service_account_file(
+            # Load service account credentials, delegated to specific user
+            delegated_credentials = _delegated_credentials(
                 self.service_account_file,
-                scopes=self.scopes
+                self.delegated_user_email
             )
             
-            # Delegate to specific user
-            delegated_credentials = credentials.with_subject(self.delegated_user_email)
-            
-            # Build service
-            self.service = build('calendar', 'v3', credentials=delegated_credentials)
-            
-            # Test the connection
-            self.service.calendarList().list().execute()
+            # Build service; bad credentials surface on the first real call
+            self.service = build_calendar_service(delegated_credentials)
             
             logger.info(f"Successfully authenticated as {self.delegated_user_email}")
             return True
@@ -55,41 +133,44 @@ class GoogleCalendarServiceAccount:
             logger.error(f"Service account authentication failed: {e}")
             return False
     
-    def create_event(
+    def _call(self, build_request: Callable[[], Any]) -> Any:
+        """Execute a request, re-authenticating once if its credentials are rejected"""
+        try:
+            return build_request().execute()
+        except HttpError as error:
+            if not _is_auth_error(error):
+                raise
+            logger.warning(f"Request rejected ({error.resp.status}), re-authenticating as {self.delegated_user_email}")
+            # Drop this user's cached services and credentials so the retry
+            # mints fresh ones; other users keep theirs
+            user = (self.service_account_file, self.delegated_user_email)
+            with self._lock:
+                for key in [k for k in self._services if k[:2] == user]:
+                    del self._services[key]
+            with _DELEGATED_CREDENTIALS_LOCK:
+                _DELEGATED_CREDENTIALS.pop(hashkey(*user), None)
+            if not self.authenticate():
+                raise
+            return build_request().execute()
+    
+    def _event_body(
         self,
         title: str,
         description: str,
         start_time: datetime,
         end_time: datetime,
         attendees: List[str],
-        meeting_link: Optional[str] = None,
-        calendar_id: str = 'primary'
-    ) -> Optional[str]:
-        """Create calendar event using service account"""
-        if not self.service:
-            if not self.authenticate():
-                return None
-        
+        meeting_link: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for a new event"""
         # Prepare event data
         event_data = {
-            'summary': f"[StandIn] {title}",
-            'description': f"📅 Scheduled by StandIn Meeting Scheduler\n\n{description}",
-            'start': {
-                'dateTime': start_time.isoformat(),
-                'timeZone': str(start_time.tzinfo) if start_time.tzinfo else 'UTC',
-            },
-            'end': {
-                'dateTime': end_time.isoformat(),
-                'timeZone': str(end_time.tzinfo) if end_time.tzinfo else 'UTC',
-            },
+            'summary': SUMMARY_PREFIX + title,
+            'description': DESCRIPTION_PREFIX + description,
+            'start': _event_time(start_time),
+            'end': _event_time(end_time),
             'attendees': [{'email': email} for email in attendees],
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'email', 'minutes': 24 * 60},
-                    {'method': 'popup', 'minutes': 30},
-                ],
-            },
+            'reminders': REMINDERS,
             'organizer': {
                 'email': self.delegated_user_email,
                 'displayName': 'StandIn Meeting Scheduler'
@@ -99,12 +180,34 @@ class GoogleCalendarServiceAccount:
         if meeting_link:
             event_data['location'] = meeting_link
         
+        return event_data
+    
+    def create_event(
+        self,
+        title: str,
+        description: str,
+        start_time: datetime,
+        end_time: datetime,
+        attendees: List[str],
+        meeting_link: Optional[str] = None,
+        calendar_id: str = 'primary',
+        send_updates: str = 'externalOnly'
+    ) -> Optional[str]:
+        """Create calendar event using service account"""
+        if not self.service:
+            if not self.authenticate():
+                return None
+        
+        event_data = self._event_body(
+            title, description, start_time, end_time, attendees, meeting_link
+        )
+        
         try:
-            event = self.service.events().insert(
+            event = self._call(lambda: self.service.events().insert(
                 calendarId=calendar_id,
                 body=event_data,
-                sendUpdates='all'
-            ).execute()
+                sendUpdates=send_updates
+            ))
             
             logger.info(f"Event created by {self.delegated_user_email}: {event.get('htmlLink')}")
             return event.get('id')
@@ -113,6 +216,43 @@ class GoogleCalendarServiceAccount:
             logger.error(f"Failed to create event: {error}")
             return None
     
+    def create_events_bulk(
+        self,
+        events: List[Dict[str, Any]],
+        calendar_id: str = 'primary',
+        send_updates: str = 'externalOnly'
+    ) -> List[Optional[str]]:
+        """Create several events with batched requests, one ID (or None) per event"""
+        if not self.service:
+            if not self.authenticate():
+                return [None] * len(events)
+        
+        requests = [
+            self.service.events().insert(
+                calendarId=calendar_id,
+                body=self._event_body(**event),
+                sendUpdates=send_updates
+            )
+            for event in events
+        ]
+        
+        try:
+            results = execute_batch(self.service, requests)
+        except Exception as e:
+            logger.error(f"Failed to create events: {e}")
+            return [None] * len(events)
+        
+        event_ids = []
+        for event, error in results:
+            if error is not None:
+                logger.error(f"Failed to create event: {error}")
+                event_ids.append(None)
+            else:
+                event_ids.append(event.get('id'))
+        
+        logger.info(f"Events created by {self.delegated_user_email}: {sum(1 for e in event_ids if e)} of {len(events)}")
+        return event_ids
+    
     def update_event(
         self,
         event_id: str,
@@ -122,47 +262,51 @@ class GoogleCalendarServiceAccount:
         end_time: Optional[datetime] = None,
         attendees: Optional[List[str]] = None,
         meeting_link: Optional[str] = None,
-        calendar_id: str = 'primary'
+        calendar_id: str = 'primary',
+        replace: bool = False,
+        send_updates: str = 'externalOnly'
     ) -> bool:
-        """Update an existing calendar event"""
+        """Update an existing calendar event (PATCH, or GET + PUT with replace=True)"""
         if not self.service:
             if not self.authenticate():
                 return False
         
         try:
-            # Get existing event
-            event = self.service.events().get(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
-            
-            # Update fields if provided
+            # Collect the fields to change
+            changes = {}
             if title:
-                event['summary'] = f"[StandIn] {title}"
+                changes['summary'] = SUMMARY_PREFIX + title
             if description:
-                event['description'] = f"📅 Scheduled by StandIn Meeting Scheduler\n\n{description}"
+                changes['description'] = DESCRIPTION_PREFIX + description
             if start_time:
-                event['start'] = {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': str(start_time.tzinfo) if start_time.tzinfo else 'UTC',
-                }
+                changes['start'] = _event_time(start_time)
             if end_time:
-                event['end'] = {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': str(end_time.tzinfo) if end_time.tzinfo else 'UTC',
-                }
+                changes['end'] = _event_time(end_time)
             if attendees:
-                event['attendees'] = [{'email': email} for email in attendees]
+                changes['attendees'] = [{'email': email} for email in attendees]
             if meeting_link:
-                event['location'] = meeting_link
+                changes['location'] = meeting_link
             
-            # Update the event
-            self.service.events().update(
-                calendarId=calendar_id,
-                eventId=event_id,
-                body=event,
-                sendUpdates='all'
-            ).execute()
+            if replace:
+                # Get existing event and update it as a whole
+                event = self._call(lambda: self.service.events().get(
+                    calendarId=calendar_id,
+                    eventId=event_id
+                ))
+                event.update(changes)
+                self._call(lambda: self.service.events().update(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    body=event,
+                    sendUpdates=send_updates
+                ))
+            else:
+                self._call(lambda: self.service.events().patch(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    body=changes,
+                    sendUpdates=send_updates
+                ))
             
             return True
             
@@ -170,18 +314,23 @@ class GoogleCalendarServiceAccount:
             logger.error(f"Failed to update event: {error}")
             return False
     
-    def delete_event(self, event_id: str, calendar_id: str = 'primary') -> bool:
+    def delete_event(
+        self,
+        event_id: str,
+        calendar_id: str = 'primary',
+        send_updates: str = 'externalOnly'
+    ) -> bool:
         """Delete a calendar event"""
         if not self.service:
             if not self.authenticate():
                 return False
         
         try:
-            self.service.events().delete(
+            self._call(lambda: self.service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id,
-                sendUpdates='all'
-            ).execute()
+                sendUpdates=send_updates
+            ))
             
             logger.info(f"Event deleted: {event_id}")
             return True
@@ -189,3 +338,36 @@ class GoogleCalendarServiceAccount:
         except HttpError as error:
             logger.error(f"Failed to delete event: {error}")
             return False
+    
+    def delete_events_bulk(
+        self,
+        event_ids: List[str],
+        calendar_id: str = 'primary',
+        send_updates: str = 'externalOnly'
+    ) -> List[bool]:
+        """Delete several calendar events with batched requests"""
+        if not self.service:
+            if not self.authenticate():
+                return [False] * len(event_ids)
+        
+        requests = [
+            self.service.events().delete(
+                calendarId=calendar_id,
+                eventId=event_id,
+                sendUpdates=send_updates
+            )
+            for event_id in event_ids
+        ]
+        
+        try:
+            results = execute_batch(self.service, requests)
+        except Exception as e:
+            logger.error(f"Failed to delete events: {e}")
+            return [False] * len(event_ids)
+        
+        deleted = []
+        for event_id, (_, error) in zip(event_ids, results):
+            if error is not None:
+                logger.error(f"Failed to delete event {event_id}: {error}")
+            deleted.append(error is None)
+        return deleted
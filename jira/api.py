@@ -1,4 +1,12 @@
+import asyncio
+import hashlib
+import threading
+
+from cachetools import TTLCache, cached
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database import get_db
 from models import Document
@@ -10,18 +18,94 @@ from schemas import (
     JiraProjectImportRequest,
     JiraProjectImportResponse,
 )
-from services.jira_service import JiraService
-from minio_client import upload_file_content, create_bucket_if_not_exists
+from services.jira_service import ISSUE_CONTENT_FIELDS, JiraService
+from minio_client import (
+    create_bucket_if_not_exists,
+    upload_executor,
+    upload_file_content,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Rows per INSERT statement when saving issue documents
+INSERT_CHUNK_SIZE = 500
+
+# Read-only lookups are often polled (dashboards); serve repeats from memory.
+# Single issues are cached by JiraService itself.
+_PROJECT_INFO_CACHE = TTLCache(maxsize=256, ttl=300)
+
+
+def _upload_issue_content(content_data: dict) -> bool:
+    """Upload one formatted issue, reporting failure instead of raising"""
+    try:
+        return upload_file_content(
+            content_data["content"], content_data["filename"]
+        )
+    except Exception as e:
+        logger.error(
+            f"Error uploading issue {content_data['issue_key']}: {str(e)}"
+        )
+        return False
+
+
+def _existing_documents(db: Session, keys: list) -> dict:
+    """
+    Map (external_link, content_hash) pairs to the IDs of the documents
+    that already hold that content for that link
+    """
+    if not keys:
+        return {}
+    return {
+        (external_link, content_hash): document_id
+        for external_link, content_hash, document_id in db.execute(
+            select(
+                Document.external_link, Document.content_hash, Document.id
+            ).where(
+                tuple_(Document.external_link, Document.content_hash).in_(keys)
+            )
+        )
+    }
+
+
+def _insert_issue_documents(db: Session, rows: list) -> list:
+    """
+    Insert document rows with one INSERT ... RETURNING per chunk and a
+    single commit. A chunk that violates a constraint is retried row by row
+    so only the offending rows are dropped.
+    """
+    statement = insert(Document).returning(
+        Document.id, sort_by_parameter_order=True
+    )
+    document_ids = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + INSERT_CHUNK_SIZE]
+        try:
+            with db.begin_nested():
+                document_ids.extend(db.execute(statement, chunk).scalars())
+            continue
+        except IntegrityError as e:
+            logger.warning(
+                f"Bulk insert of {len(chunk)} issue documents failed, "
+                f"retrying row by row: {str(e)}"
+            )
+
+        for row in chunk:
+            try:
+                with db.begin_nested():
+                    document_ids.append(db.execute(statement, [row]).scalar_one())
+            except IntegrityError as e:
+                logger.error(
+                    f"Error saving document {row['filename']}: {str(e)}"
+                )
+    db.commit()
+    return document_ids
 
 
 @router.post("/search", response_model=JiraSearchResponse)
-def search_jira_issues(
+async def search_jira_issues(
     request: JiraSearchRequest, db: Session = Depends(get_db)
 ):
     """
@@ -33,8 +117,12 @@ def search_jira_issues(
 
         # Search issues using JQL
         logger.info(f"Searching JIRA issues with JQL: {request.jql}")
-        issues = jira_service.search_issues_by_jql(
-            request.jql, request.max_results
+        issues = await asyncio.to_thread(
+            jira_service.search_issues_by_jql,
+            request.jql,
+            request.max_results,
+            ISSUE_CONTENT_FIELDS,
+            None,
         )
 
         if not issues:
@@ -45,44 +133,77 @@ def search_jira_issues(
             )
 
         # Ensure bucket exists
-        create_bucket_if_not_exists()
-
-        document_ids = []
+        await asyncio.to_thread(create_bucket_if_not_exists)
 
-        # Process each issue
+        # Format content for each issue; hoist the bound method and link
+        # prefix out of the loop, it runs once per issue
+        format_issue_content = jira_service.format_issue_content
+        browse_url = jira_service.base_url + "/browse/"
+        contents = []
         for issue_data in issues:
             try:
-                # Format content for this issue
-                content_data = jira_service.format_issue_content(issue_data)
-
-                # Upload content to MinIO
-                upload_success = upload_file_content(
-                    content_data["content"], content_data["filename"]
+                content_data = format_issue_content(issue_data)
+                content_data["external_link"] = (
+                    browse_url + content_data["issue_key"]
                 )
-
-                if upload_success:
-                    # Save document metadata to database
-                    document = Document(
-                        content=content_data["json_content"],
-                        filename=content_data["filename"],
-                        bucket=request.bucket,
-                        external_link=f"{jira_service.base_url}/browse/{content_data['issue_key']}",
-                    )
-
-                    db.add(document)
-                    db.commit()
-                    db.refresh(document)
-
-                    document_ids.append(document.id)
-                    logger.info(
-                        f"Successfully created document {document.id} for issue {content_data['issue_key']}"
-                    )
-
+                content_data["content_hash"] = hashlib.sha256(
+                    content_data["content"].encode("utf-8")
+                ).hexdigest()
+                contents.append(content_data)
             except Exception as e:
                 logger.error(
                     f"Error processing issue {issue_data.get('key', 'Unknown')}: {str(e)}"
                 )
-                continue
+
+        # Issues whose current content was already imported reuse that
+        # document; look them all up in one query and skip their upload and
+        # insert
+        existing = await run_in_threadpool(
+            _existing_documents,
+            db,
+            [
+                (content_data["external_link"], content_data["content_hash"])
+                for content_data in contents
+            ],
+        )
+        contents = [
+            content_data
+            for content_data in contents
+            if (content_data["external_link"], content_data["content_hash"])
+            not in existing
+        ]
+
+        # Upload content to MinIO on the bounded upload pool, off the
+        # event loop
+        loop = asyncio.get_running_loop()
+        uploaded = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    upload_executor, _upload_issue_content, content_data
+                )
+                for content_data in contents
+            ]
+        )
+
+        # Save metadata for every uploaded issue
+        rows = [
+            {
+                "content": content_data["json_content"],
+                "filename": content_data["filename"],
+                "bucket": request.bucket,
+                "storage_key": content_data["filename"],
+                "external_link": content_data["external_link"],
+                "content_hash": content_data["content_hash"],
+                "upload_status": "uploaded",
+            }
+            for content_data, upload_success in zip(contents, uploaded)
+            if upload_success
+        ]
+        created_ids = await run_in_threadpool(
+            _insert_issue_documents, db, rows
+        )
+        logger.info(f"Created documents {created_ids} for JQL: {request.jql}")
+        document_ids = list(existing.values()) + created_ids
 
         return JiraSearchResponse(
             document_ids=document_ids,
@@ -115,15 +236,25 @@ def test_jira_connection():
         )
 
 
+@cached(_PROJECT_INFO_CACHE, lock=threading.Lock())
+def _get_project_info(project_key: str) -> dict:
+    """Project issue summary, cached for five minutes"""
+    return JiraService().summarize_project_issues(project_key)
+
+
 @router.get("/issue/{issue_key}")
-def get_jira_issue_by_key(issue_key: str):
+async def get_jira_issue_by_key(issue_key: str):
     """
     Get JIRA issue details by key (without saving to database)
     """
     try:
         jira_service = JiraService()
-        issue_data = jira_service.fetch_issue_by_key(issue_key)
-        subtasks = jira_service.fetch_issue_subtasks(issue_key)
+
+        # Fetch the issue and its subtasks concurrently
+        issue_data, subtasks = await asyncio.gather(
+            asyncio.to_thread(jira_service.fetch_issue_by_key, issue_key),
+            asyncio.to_thread(jira_service.fetch_issue_subtasks, issue_key),
+        )
         content_data = jira_service.format_issue_content(issue_data, subtasks)
 
         return {
@@ -144,25 +275,7 @@ def get_jira_project_info(project_key: str):
     Get JIRA project information and issue summary (without saving to database)
     """
     try:
-        jira_service = JiraService()
-        project_data = jira_service.process_project_issues(project_key)
-
-        return {
-            "project_key": project_data["project_key"],
-            "project_name": project_data["project_name"],
-            "total_issues": project_data["total_issues"],
-            "issues_by_type": project_data["issues_by_type"],
-            "issues_by_type_data": {
-                k: [
-                    {
-                        "key": issue.get("key"),
-                        "summary": issue.get("fields", {}).get("summary"),
-                    }
-                    for issue in v
-                ]
-                for k, v in project_data["issues_by_type_data"].items()
-            },
-        }
+        return _get_project_info(project_key)
     except Exception as e:
         raise HTTPException(
             status_code=500,
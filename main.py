@@ -1,11 +1,18 @@
+import asyncio
+from contextlib import asynccontextmanager
 from typing import List
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 import uvicorn
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 
+from config import settings
 from database import engine, Base, get_db
+from minio_client import create_bucket_if_not_exists
 from models import User, Project
 from schemas import UserResponse
 from document.api import router as document_api
@@ -13,24 +20,46 @@ from confluence.api import router as confluence_api
 from jira.api import router as jira_api
 from meeting.api import router as meeting_api
 from project.api import router as project_api
-from meeting.api import router as meeting_api
 
-# Database tables are managed by Alembic migrations
-# Base.metadata.create_all(bind=engine)  # Disabled automatic schema sync
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Database tables are managed by Alembic migrations; this only helps
+    # local setups that opt in
+    if settings.AUTO_CREATE_TABLES:
+        await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+
+    # Routes still call create_bucket_if_not_exists, which is a no-op once
+    # this succeeds and retries if MinIO was not reachable yet
+    try:
+        await asyncio.to_thread(create_bucket_if_not_exists)
+    except Exception as e:
+        logger.warning(f"Could not initialize MinIO bucket: {e}")
+        logger.warning("Make sure MinIO server is running")
+
+    yield
+
 
 app = FastAPI(
     title="FastAPI Boilerplate",
     description="A FastAPI application with PostgreSQL and MinIO",
     version="1.0.0",
+    # Serialize responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Let browsers reuse preflight responses instead of repeating OPTIONS
+    max_age=settings.CORS_MAX_AGE,
 )
 
 
@@ -48,16 +77,17 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "timestamp": datetime.now(datetime.timezone.utc),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
 
 @app.get("/users/", response_model=List[UserResponse])
-async def get_users(
+def get_users(
     skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    # Plain def: the session is synchronous, so FastAPI runs this in its
+    # threadpool instead of blocking the event loop on the query
+    return db.scalars(select(User).offset(skip).limit(limit)).all()
 
 
 app.include_router(document_api, prefix="/document", tags=["document"])
@@ -65,7 +95,6 @@ app.include_router(confluence_api, prefix="/confluence", tags=["confluence"])
 app.include_router(jira_api, prefix="/jira", tags=["jira"])
 app.include_router(meeting_api, prefix="/meeting", tags=["meeting"])
 app.include_router(project_api, prefix="/project", tags=["project"])
-app.include_router(meeting_api, prefix="/meeting", tags=["meeting"])
 
 
 if __name__ == "__main__":
@@ -12,10 +12,11 @@ from fastapi import (
     UploadFile,
     requests,
 )
-from sqlalchemy.orm import Session, joinedload
-from config import settings
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 from database import get_db
 from meeting.service import create_narration
+from document.service import build_storage_key, dump_json
 from models import Meeting, Document, Project
 from schemas import (
     DocumentResponse,
@@ -28,7 +29,6 @@ from google_calendar_service import GoogleCalendarService
 from google_service_account import GoogleCalendarServiceAccount
 from minio_client import upload_file_content
 from typing import List, Optional
-import json
 import logging
 import requests
 
@@ -75,13 +75,16 @@ def create_meeting_documents(
                 external_link=doc_data.get("external_link"),
             )
             db.add(document)
+            db.flush()
+            document.storage_key = build_storage_key(document)
             db.commit()
             db.refresh(document)
 
             # Upload to MinIO
-            json_content = json.dumps(document.content, indent=2)
             upload_file_content(
-                json_content, f"{document.id}_{document.filename}"
+                dump_json(document.content),
+                document.storage_key,
+                content_type="application/json",
             )
 
             document_ids.append(document.id)
@@ -107,6 +110,7 @@ async def import_meeting_document(
     include_subtasks: bool = True,
     content: Optional[str] = None,
     file: Optional[UploadFile] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> Optional[DocumentImportResponse]:
     """Import a document and link it to a meeting using the document API functions"""
     try:
@@ -114,29 +118,36 @@ async def import_meeting_document(
 
         if source == "url" and url and _handle_url_import:
             document_response = await _handle_url_import(
-                source, url, include_subtasks, None, db
+                source, url, include_subtasks, None, db, background_tasks
             )
         elif source == "file" and file and _handle_file_import:
             document_response = await _handle_file_import(
-                source, file, filename, None, db
+                source, file, filename, None, db, background_tasks
             )
         elif source == "content" and content and _handle_content_import:
             document_response = await _handle_content_import(
-                source, content, filename, None, db
+                source, content, filename, None, db, background_tasks
             )
 
         if document_response:
-            # Link the created document to the meeting
-            document = (
+            # Link the created document(s) to the meeting; board imports
+            # produce one document per issue
+            metadata = document_response.metadata or {}
+            document_ids = metadata.get(
+                "document_ids", [document_response.document_id]
+            )
+            linked = (
                 db.query(Document)
-                .filter(Document.id == document_response.document_id)
-                .first()
+                .filter(Document.id.in_(document_ids))
+                .update(
+                    {Document.meeting_id: meeting_id},
+                    synchronize_session=False,
+                )
             )
-            if document:
-                document.meeting_id = meeting_id
-                db.commit()
+            db.commit()
+            if linked:
                 logger.info(
-                    f"Document {document.id} linked to meeting {meeting_id}"
+                    f"Documents {document_ids} linked to meeting {meeting_id}"
                 )
 
         return document_response
@@ -194,6 +205,8 @@ def schedule_google_calendar_event(meeting: Meeting) -> str:
             end_time=meeting.end_time,
             attendees=meeting.attendees or [],
             meeting_link=meeting.meeting_link,
+            # Attendees expect the invitation email right away
+            send_updates="all",
         )
 
         return event_id
@@ -312,6 +325,7 @@ async def schedule_meeting(
                 include_subtasks=meeting_data.include_subtasks,
                 content=meeting_data.document_content,
                 file=meeting_data.document_file,
+                background_tasks=background_tasks,
             )
 
         # Schedule in Google Calendar (background task)
@@ -348,7 +362,7 @@ def get_meetings(
     db: Session = Depends(get_db),
 ):
     """Get all meetings with optional filtering"""
-    query = db.query(Meeting).options(joinedload(Meeting.documents))
+    query = db.query(Meeting).options(selectinload(Meeting.documents))
 
     if project_id:
         query = query.filter(Meeting.project_id == project_id)
@@ -365,7 +379,7 @@ def get_meeting(meeting_id: int, db: Session = Depends(get_db)):
     """Get a specific meeting by ID"""
     meeting = (
         db.query(Meeting)
-        .options(joinedload(Meeting.documents))
+        .options(selectinload(Meeting.documents))
         .filter(Meeting.id == meeting_id)
         .first()
     )
@@ -382,17 +396,22 @@ def update_meeting(
     db: Session = Depends(get_db),
 ):
     """Update an existing meeting"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-
-    # Update fields
+    # Update fields with one UPDATE, then load the row for the response
     update_data = meeting_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(meeting, field, value)
+    if update_data:
+        db.query(Meeting).filter(Meeting.id == meeting_id).update(
+            update_data, synchronize_session=False
+        )
+        db.commit()
 
-    db.commit()
-    db.refresh(meeting)
+    meeting = (
+        db.query(Meeting)
+        .options(selectinload(Meeting.documents))
+        .filter(Meeting.id == meeting_id)
+        .first()
+    )
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Update Google Calendar event if it exists
     if meeting.google_calendar_event_id:
@@ -406,6 +425,7 @@ def update_meeting(
             meeting_update.end_time,
             meeting_update.attendees,
             meeting_update.meeting_link,
+            send_updates="all",
         )
 
     return meeting
@@ -418,49 +438,40 @@ def cancel_meeting(
     db: Session = Depends(get_db),
 ):
     """Cancel a meeting and remove from Google Calendar"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
+    # Update status to cancelled, reading back the calendar event to remove
+    cancelled = db.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(status="cancelled")
+        .returning(Meeting.google_calendar_event_id)
+    ).first()
+    if not cancelled:
         raise HTTPException(status_code=404, detail="Meeting not found")
-
-    # Update status to cancelled
-    meeting.status = "cancelled"
     db.commit()
 
     # Delete from Google Calendar if it exists
-    if meeting.google_calendar_event_id:
+    google_calendar_event_id = cancelled.google_calendar_event_id
+    if google_calendar_event_id:
         calendar_service = GoogleCalendarService()
         background_tasks.add_task(
-            calendar_service.delete_event, meeting.google_calendar_event_id
+            calendar_service.delete_event,
+            google_calendar_event_id,
+            send_updates="all",
         )
 
     return {"message": f"Meeting {meeting_id} has been cancelled"}
 
 
-@router.get("/{meeting_id}/documents")
-def get_meeting_documents(meeting_id: int, db: Session = Depends(get_db)):
-    """Get all documents associated with a meeting"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-
-    # For now, return documentation links
-    # In the future, you might want to create a relationship
-    # between meetings and documents
-    return {
-        "meeting_id": meeting_id,
-        "documentation_links": meeting.documentation_links or [],
-        "additional_information": meeting.additional_information,
-    }
-
-
 @router.post("/{meeting_id}/complete")
 def complete_meeting(meeting_id: int, db: Session = Depends(get_db)):
     """Mark a meeting as completed"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
+    updated = (
+        db.query(Meeting)
+        .filter(Meeting.id == meeting_id)
+        .update({Meeting.status: "completed"}, synchronize_session=False)
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="Meeting not found")
-
-    meeting.status = "completed"
     db.commit()
 
     return {"message": f"Meeting {meeting_id} marked as completed"}
@@ -547,6 +558,7 @@ def stop_meeting(meeting_id: int, db: Session = Depends(get_db)):
 )
 async def import_document_to_meeting(
     meeting_id: int,
+    background_tasks: BackgroundTasks,
     source: str = Form(...),
     url: Optional[str] = Form(None),
     filename: Optional[str] = Form(None),
@@ -558,7 +570,12 @@ async def import_document_to_meeting(
     """Import a document and link it to an existing meeting"""
     try:
         # Check if meeting exists
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        meeting = (
+            db.query(Meeting)
+            .options(raiseload("*"))
+            .filter(Meeting.id == meeting_id)
+            .first()
+        )
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -572,6 +589,7 @@ async def import_document_to_meeting(
             include_subtasks=include_subtasks,
             content=content,
             file=file,
+            background_tasks=background_tasks,
         )
 
         if not document_response:
@@ -598,20 +616,25 @@ def link_document_to_meeting(
 ):
     """Link an existing document to a meeting"""
     try:
-        # Check if meeting exists
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if not meeting:
-            raise HTTPException(status_code=404, detail="Meeting not found")
-
-        # Check if document exists
-        document = (
-            db.query(Document).filter(Document.id == document_id).first()
+        # Link document to meeting, provided the meeting exists
+        linked = (
+            db.query(Document)
+            .filter(
+                Document.id == document_id,
+                exists().where(Meeting.id == meeting_id),
+            )
+            .update(
+                {Document.meeting_id: meeting_id}, synchronize_session=False
+            )
         )
-        if not document:
+        if not linked:
+            # Nothing was updated; find out which of the two is missing
+            meeting_exists = db.execute(
+                select(exists().where(Meeting.id == meeting_id))
+            ).scalar()
+            if not meeting_exists:
+                raise HTTPException(status_code=404, detail="Meeting not found")
             raise HTTPException(status_code=404, detail="Document not found")
-
-        # Link document to meeting
-        document.meeting_id = meeting_id
         db.commit()
 
         return {
@@ -633,7 +656,12 @@ def get_meeting_documents(meeting_id: int, db: Session = Depends(get_db)):
     """Get all documents linked to a specific meeting"""
     try:
         # Check if meeting exists
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        meeting = (
+            db.query(Meeting)
+            .options(raiseload("*"))
+            .filter(Meeting.id == meeting_id)
+            .first()
+        )
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
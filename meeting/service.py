@@ -1,6 +1,6 @@
 import logging
 import requests
-from config import settings
+from config import get_settings
 from models import Document, Meeting
 from database import get_db
 from sqlalchemy.orm import Session
@@ -36,7 +36,7 @@ def create_narration(meeting: Meeting, db: Session) -> Meeting:
     # Convert timedelta to seconds (integer)
     duration = int((meeting.end_time - meeting.start_time).total_seconds())
     
-    external_api_url = f"{settings.AI_MEETING_SERVICE_END_POINT}/create_meeting_narration"
+    external_api_url = f"{get_settings().AI_MEETING_SERVICE_END_POINT}/create_meeting_narration"
     response = requests.post(external_api_url, json=AIMeetingNarrationRequest(documents=documents, attendee=attendee, duration=duration).dict())
     """the response will be an array of narrations it should be stored in the meeting meta_data"""
     meeting.meta_data = response.json()
@@ -2,7 +2,10 @@ from minio import Minio
 from minio.error import S3Error
 import logging
 from config import settings
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from typing import Union
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,15 +21,29 @@ minio_client = Minio(
 
 BUCKET_NAME = settings.MINIO_BUCKET_NAME
 
+# Bounded pool for running uploads concurrently; the client above is
+# thread-safe and shared by every worker
+upload_executor = ThreadPoolExecutor(
+    max_workers=settings.MINIO_UPLOAD_CONCURRENCY,
+    thread_name_prefix="minio-upload",
+)
+
+
+# Set once the bucket is known to exist, so later calls skip the round-trip
+_bucket_ready = threading.Event()
+
 
 def create_bucket_if_not_exists():
     """Create bucket if it doesn't exist"""
+    if _bucket_ready.is_set():
+        return
     try:
         if not minio_client.bucket_exists(BUCKET_NAME):
             minio_client.make_bucket(BUCKET_NAME)
             logger.info(f"Bucket '{BUCKET_NAME}' created successfully")
         else:
             logger.info(f"Bucket '{BUCKET_NAME}' already exists")
+        _bucket_ready.set()
     except S3Error as e:
         logger.error(f"Error creating bucket: {e}")
         raise
@@ -57,12 +74,22 @@ def download_file(object_name: str):
         return None
 
 
-def upload_file_content(content: str, object_name: str):
+def upload_file_content(
+    content: Union[str, bytes],
+    object_name: str,
+    content_type: str = "application/octet-stream",
+):
     """Upload a file content to MinIO bucket"""
     try:
-        # Convert string content to BytesIO object
-        content_bytes = BytesIO(content.encode('utf-8'))
-        minio_client.put_object(BUCKET_NAME, object_name, content_bytes, length=len(content.encode('utf-8')))
+        # Encode text once and stream the bytes with a known length
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        minio_client.put_object(
+            BUCKET_NAME,
+            object_name,
+            BytesIO(data),
+            length=len(data),
+            content_type=content_type,
+        )
         logger.info(f"File content uploaded to '{object_name}'")
         return True
     except S3Error as e:
@@ -91,9 +118,4 @@ def list_files():
         return []
 
 
-# Initialize bucket on import
-# try:
-#     create_bucket_if_not_exists()
-# except Exception as e:
-#     logger.warning(f"Could not initialize MinIO bucket: {e}")
-#     logger.warning("Make sure MinIO server is running")
+# The bucket is initialized from the application startup hook in main.py
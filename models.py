@@ -1,5 +1,5 @@
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, ForeignKey, Enum
+    Column, Integer, String, DateTime, Boolean, ForeignKey, Enum, Index
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -70,7 +70,7 @@ class Document(Base):
     __tablename__ = "documents"
 
     id = Column(Integer, primary_key=True, index=True)
-    content = Column(JSON, nullable=True)
+    content = Column(JSONB, nullable=True)
     filename = Column(String(255), nullable=True)
     bucket = Column(String(255), nullable=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
@@ -80,7 +80,26 @@ class Document(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     external_link = Column(String(255), nullable=True)
+    # MinIO object name, fixed at insert time
+    storage_key = Column(String(512), nullable=True, index=True)
+    # pending | uploaded | failed
+    upload_status = Column(String(20), nullable=True)
+    # SHA-256 of the pulled text, used to skip re-pulls of identical pages;
+    # only meaningful together with external_link
+    content_hash = Column(String(64), nullable=True, index=True)
+    # Source version (Confluence version.number) at the time of the pull
+    external_version = Column(Integer, nullable=True)
 
     # Relationships
     project = relationship("Project", back_populates="documents")
     meeting = relationship("Meeting", back_populates="documents")
+
+    __table_args__ = (
+        # The same text pulled from two sources is two documents
+        Index(
+            "uq_documents_external_link_content_hash",
+            "external_link",
+            "content_hash",
+            unique=True,
+        ),
+    )
@@ -55,10 +55,14 @@ class ConfluencePageRequest(BaseModel):
 
 class ConfluencePageResponse(BaseModel):
     document_id: int
-    title: str
+    # "pulled", or "unchanged" when the stored document was reused
+    status: str = "pulled"
+    # Not re-fetched when the page is unchanged since the last pull
+    title: Optional[str] = None
     filename: str
     page_id: str
-    space_name: str
+    space_name: Optional[str] = None
+    version: Optional[int] = None
     message: str
 
 
@@ -136,6 +140,25 @@ class DocumentResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     external_link: Optional[str] = None
+    upload_status: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DocumentSummary(BaseModel):
+    """Document metadata for listings (content is not loaded)"""
+
+    id: int
+    filename: Optional[str] = None
+    bucket: Optional[str] = None
+    project_id: Optional[int] = None
+    meeting_id: Optional[int] = None
+    doc_type: DocumentType
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    external_link: Optional[str] = None
+    upload_status: Optional[str] = None
 
     class Config:
         from_attributes = True
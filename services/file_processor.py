@@ -6,9 +6,10 @@ import os
 import re
 import mimetypes
 import base64
-from typing import Dict, Any, Optional, Tuple, Union
+import hashlib
+from io import BytesIO
+from typing import BinaryIO, Dict, Any, Optional, Tuple, Union
 from fastapi import UploadFile
-import json
 from datetime import datetime
 
 # Import document processing libraries
@@ -37,6 +38,15 @@ except ImportError:
     PPTX_AVAILABLE = False
 
 
+# Read size used when hashing uploads, keeps memory flat for large files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _as_stream(content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Wrap raw bytes in a stream; file objects are used as they are"""
+    return BytesIO(content) if isinstance(content, (bytes, bytearray)) else content
+
+
 class FileProcessor:
     """Service for processing uploaded files"""
     
@@ -87,13 +97,33 @@ class FileProcessor:
         """Check if file is a text-based file"""
         return content_type in cls.SUPPORTED_TEXT_TYPES
     
+    @classmethod
+    async def file_digest(cls, file: UploadFile) -> Tuple[str, int]:
+        """Compute the SHA-256 and size of an upload in fixed-size chunks"""
+        digest = hashlib.sha256()
+        size = 0
+        await file.seek(0)
+        while chunk := await file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        await file.seek(0)
+        return digest.hexdigest(), size
+    
     @classmethod
     async def read_file_content(cls, file: UploadFile) -> Tuple[str, str]:
         """Read file content with enhanced extraction for different file types"""
-        content = await file.read()
         filename = file.filename or "unknown"
         content_type = file.content_type or "application/octet-stream"
         
+        # Document parsers read straight from the spooled upload file
+        # rather than from an in-memory copy of it
+        if content_type in cls.SUPPORTED_DOCUMENT_TYPES:
+            await file.seek(0)
+            extracted_content = cls.extract_document_content(file.file, content_type, filename)
+            return extracted_content, filename
+        
+        content = await file.read()
+        
         # Handle text files
         if cls.is_text_file(content_type):
             try:
@@ -111,18 +141,13 @@ class FileProcessor:
                 encoded_content = base64.b64encode(content).decode('utf-8')
                 return f"Binary file content (base64): {encoded_content}", filename
         
-        # Handle document files
-        elif content_type in cls.SUPPORTED_DOCUMENT_TYPES:
-            extracted_content = cls.extract_document_content(content, content_type, filename)
-            return extracted_content, filename
-        
         # Fallback for unsupported files
         else:
             encoded_content = base64.b64encode(content).decode('utf-8')
             return f"Unsupported file type: {content_type}\nBinary content (base64): {encoded_content}", filename
 
     @classmethod
-    def extract_document_content(cls, content: bytes, content_type: str, filename: str) -> str:
+    def extract_document_content(cls, content: Union[bytes, BinaryIO], content_type: str, filename: str) -> str:
         """Extract text content from various document formats"""
         try:
             if content_type == 'application/pdf':
@@ -141,14 +166,13 @@ class FileProcessor:
             return f"Error extracting content from {filename}: {str(e)}"
 
     @classmethod
-    def extract_pdf_content(cls, content: bytes) -> str:
+    def extract_pdf_content(cls, content: Union[bytes, BinaryIO]) -> str:
         """Extract text content from PDF"""
         if not PDF_AVAILABLE:
             return "PDF processing not available. Please install PyPDF2."
         
         try:
-            from io import BytesIO
-            pdf_file = BytesIO(content)
+            pdf_file = _as_stream(content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
             
             text_content = []
@@ -162,14 +186,13 @@ class FileProcessor:
             return f"Error extracting PDF content: {str(e)}"
 
     @classmethod
-    def extract_docx_content(cls, content: bytes) -> str:
+    def extract_docx_content(cls, content: Union[bytes, BinaryIO]) -> str:
         """Extract text content from DOCX"""
         if not DOCX_AVAILABLE:
             return "DOCX processing not available. Please install python-docx."
         
         try:
-            from io import BytesIO
-            docx_file = BytesIO(content)
+            docx_file = _as_stream(content)
             doc = DocxDocument(docx_file)
             
             paragraphs = []
@@ -182,14 +205,13 @@ class FileProcessor:
             return f"Error extracting DOCX content: {str(e)}"
 
     @classmethod
-    def extract_xlsx_content(cls, content: bytes) -> str:
+    def extract_xlsx_content(cls, content: Union[bytes, BinaryIO]) -> str:
         """Extract text content from XLSX"""
         if not XLSX_AVAILABLE:
             return "XLSX processing not available. Please install openpyxl."
         
         try:
-            from io import BytesIO
-            xlsx_file = BytesIO(content)
+            xlsx_file = _as_stream(content)
             workbook = openpyxl.load_workbook(xlsx_file)
             
             content_lines = []
@@ -208,14 +230,13 @@ class FileProcessor:
             return f"Error extracting XLSX content: {str(e)}"
 
     @classmethod
-    def extract_pptx_content(cls, content: bytes) -> str:
+    def extract_pptx_content(cls, content: Union[bytes, BinaryIO]) -> str:
         """Extract text content from PPTX"""
         if not PPTX_AVAILABLE:
             return "PPTX processing not available. Please install python-pptx."
         
         try:
-            from io import BytesIO
-            pptx_file = BytesIO(content)
+            pptx_file = _as_stream(content)
             presentation = Presentation(pptx_file)
             
             content_lines = []
@@ -1,18 +1,215 @@
-import os
+import base64
+import html
+import logging
 import re
-import json
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from urllib.parse import urlparse
+import orjson
 import requests
-from config import settings
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Patterns used per issue, compiled once
+_BROWSE_KEY_RE = re.compile(r'/browse/([A-Z]+-\d+)')
+_ISSUES_KEY_RE = re.compile(r'/issues/([A-Z]+-\d+)')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_DASH_RUN_RE = re.compile(r'[-\s]+')
+
+
+# Recently fetched issues, subtask lists and projects, shared by every
+# JiraService; keyed by JIRA site and issue or project key
+_ISSUE_CACHE = TTLCache(maxsize=1024, ttl=60)
+_SUBTASK_CACHE = TTLCache(maxsize=1024, ttl=60)
+# Project metadata rarely changes; nothing here writes to JIRA, anything that
+# starts to should clear these caches
+_PROJECT_CACHE = TTLCache(maxsize=256, ttl=300)
+
+
+def _issue_cache_key(service: "JiraService", key: str):
+    return hashkey(service.base_url, key)
+
+
+# Issues requested per search call; JIRA may return fewer per page
+SEARCH_PAGE_SIZE = 500
+
+# Issue fields read by format_issue_content; searches feeding it ask for
+# just these instead of every field on the issue
+ISSUE_CONTENT_FIELDS = (
+    "summary,description,issuetype,status,priority,assignee,reporter,"
+    "created,updated,project"
+)
+# ... and by format_issue_for_storage, which adds the epic fields and the
+# subtask list
+ISSUE_STORAGE_FIELDS = (
+    ISSUE_CONTENT_FIELDS + ",customfield_10014,customfield_10015,subtasks"
+)
+
+# Parent keys per "parent in (...)" subtask search
+SUBTASK_PARENTS_PER_SEARCH = 50
+
+# Issue type name (lowercased) -> group in the project summaries
+ISSUE_TYPE_GROUPS = {
+    "epic": "epics",
+    "story": "stories",
+    "task": "tasks",
+    "sub-task": "subtasks",
+    "bug": "bugs",
+}
+ISSUE_TYPE_GROUP_NAMES = ("epics", "stories", "tasks", "subtasks", "bugs", "other")
+
+
+# Deletes the ASCII characters _UNSAFE_CHARS_RE would remove, in one pass
+_UNSAFE_ASCII_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if _UNSAFE_CHARS_RE.match(c)}
+)
+
+
+def _safe_name(text: str) -> str:
+    """Reduce free text (e.g. an issue summary) to a filename-safe slug"""
+    # Summaries are nearly always ASCII; str.translate handles those without
+    # the regex, anything else keeps the Unicode-aware pattern
+    if text.isascii():
+        text = text.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        text = _UNSAFE_CHARS_RE.sub('', text)
+    return _DASH_RUN_RE.sub('-', text.strip())
+
+
+class RateLimiter:
+    """
+    Spaces out requests using the pacing JIRA Cloud advertises in its
+    X-RateLimit-* headers, and holds everyone back after a 429.
+    max_rate (requests per second, 0 for none) is a ceiling that applies
+    even when the server advertises nothing.
+    """
+
+    def __init__(self, max_rate: float = 0):
+        self.base_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.min_interval = self.base_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's turn under the current pacing"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def update(self, response: requests.Response):
+        """Adopt the pacing and back-off advertised by a response"""
+        headers = response.headers
+        try:
+            fill_rate = float(headers["X-RateLimit-FillRate"])
+            interval = float(headers["X-RateLimit-Interval-Seconds"])
+            if fill_rate > 0:
+                self.min_interval = max(self.base_interval, interval / fill_rate)
+        except (KeyError, ValueError):
+            pass
+
+        if response.status_code == 429:
+            try:
+                retry_after = float(headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+            with self._lock:
+                self._next_slot = max(
+                    self._next_slot, time.monotonic() + retry_after
+                )
+
+
+class RateLimitedSession(requests.Session):
+    """
+    requests.Session that paces every request through a RateLimiter and
+    caps how many are in flight at once, across all threads using it
+    """
+
+    def __init__(
+        self, timeout: float = None, max_rate: float = 0, max_in_flight: int = 8
+    ):
+        super().__init__()
+        self.rate_limiter = RateLimiter(max_rate)
+        self.timeout = timeout
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def request(self, *args, **kwargs) -> requests.Response:
+        # requests has no session-wide timeout; apply ours unless overridden
+        kwargs.setdefault("timeout", self.timeout)
+        with self._in_flight:
+            self.rate_limiter.wait()
+            response = super().request(*args, **kwargs)
+        self.rate_limiter.update(response)
+        return response
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson"""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Keep the requests exception type so existing handlers catch it
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+
+@lru_cache(maxsize=8)
+def jira_session(
+    auth: Tuple[str, str], pool_size: int, timeout: float, max_rate: float = 0
+) -> requests.Session:
+    """
+    Keep-alive session shared by every JiraService with the same account.
+    Idempotent requests are retried on 429/5xx, honouring Retry-After.
+    """
+    # Never run more requests than the adapter keeps connections for, so
+    # bursts from several imports queue here instead of opening and
+    # discarding extra connections
+    session = RateLimitedSession(timeout, max_rate, max_in_flight=pool_size)
+    session.headers["Accept"] = "application/json"
+    # Encode the Basic credentials once rather than on every request
+    user, token = auth
+    credentials = base64.b64encode(f"{user}:{token}".encode("utf-8")).decode("ascii")
+    session.headers["Authorization"] = f"Basic {credentials}"
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class JiraService:
     def __init__(self):
-        self.base_url = settings.JIRA_URL
+        settings = get_settings()
+        self.base_url = settings.JIRA_URL.rstrip("/")
         self.username = settings.JIRA_USER
         self.token = settings.JIRA_TOKEN
         self.auth = (self.username, self.token)
+        self.session = jira_session(
+            self.auth,
+            settings.JIRA_POOL_MAXSIZE,
+            settings.JIRA_TIMEOUT,
+            settings.JIRA_MAX_RPS,
+        )
 
     def extract_issue_key_from_url(self, url: str) -> Optional[str]:
         """Extract issue key from JIRA URL"""
@@ -25,12 +222,12 @@ class JiraService:
             parsed_url = urlparse(url)
             
             # Check for browse pattern
-            browse_match = re.search(r'/browse/([A-Z]+-\d+)', parsed_url.path)
+            browse_match = _BROWSE_KEY_RE.search(parsed_url.path)
             if browse_match:
                 return browse_match.group(1)
             
             # Check for issues pattern
-            issues_match = re.search(r'/issues/([A-Z]+-\d+)', parsed_url.path)
+            issues_match = _ISSUES_KEY_RE.search(parsed_url.path)
             if issues_match:
                 return issues_match.group(1)
             
@@ -47,31 +244,63 @@ class JiraService:
         
         return self.fetch_issue_by_key(issue_key)
 
+    @cached(_ISSUE_CACHE, key=_issue_cache_key, lock=threading.Lock())
     def fetch_issue_by_key(self, issue_key: str) -> Dict[str, Any]:
-        """Fetch JIRA issue by key"""
+        """Fetch JIRA issue by key, served from memory for a minute"""
         try:
             url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
-            response = requests.get(url, auth=self.auth)
+            response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return _json(response)
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching issue {issue_key}: {str(e)}")
 
     def fetch_issue_subtasks(self, issue_key: str) -> List[Dict[str, Any]]:
         """Fetch subtasks for a JIRA issue"""
         try:
-            url = f"{self.base_url}/rest/api/2/search"
-            params = {
-                "jql": f"parent = {issue_key}",
-                "expand": "changelog"
-            }
-            response = requests.get(url, auth=self.auth, params=params)
-            response.raise_for_status()
-            return response.json().get("issues", [])
+            return self._fetch_issue_subtasks(issue_key)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching subtasks for {issue_key}: {str(e)}")
             return []
 
+    def fetch_subtasks_for_issues(self, issue_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Subtasks of several issues with one search per chunk of parents,
+        grouped by parent key (issues without subtasks are left out)
+        """
+        subtasks_by_parent: Dict[str, List[Dict[str, Any]]] = {}
+        for start in range(0, len(issue_keys), SUBTASK_PARENTS_PER_SEARCH):
+            parents = issue_keys[start:start + SUBTASK_PARENTS_PER_SEARCH]
+            try:
+                subtasks = self.search_issues_by_jql(
+                    f"parent in ({','.join(parents)})",
+                    max_results=10000,
+                    fields="summary,status,parent",
+                    expand=None
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Error fetching subtasks for {', '.join(parents)}, "
+                    f"their subtasks are left out: {str(e)}"
+                )
+                continue
+            for subtask in subtasks:
+                parent_key = subtask.get("fields", {}).get("parent", {}).get("key")
+                subtasks_by_parent.setdefault(parent_key, []).append(subtask)
+        return subtasks_by_parent
+
+    @cached(_SUBTASK_CACHE, key=_issue_cache_key, lock=threading.Lock())
+    def _fetch_issue_subtasks(self, issue_key: str) -> List[Dict[str, Any]]:
+        """Subtask search, cached for a minute; failures are not cached"""
+        url = f"{self.base_url}/rest/api/2/search"
+        params = {
+            "jql": f"parent = {issue_key}",
+            "expand": "changelog"
+        }
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        return _json(response).get("issues", [])
+
     def format_issue_content(self, issue_data: Dict[str, Any], subtasks: List[Dict[str, Any]] = None) -> Dict[str, str]:
         """Format issue data into readable content"""
         fields = issue_data.get("fields", {})
@@ -97,47 +326,43 @@ class JiraService:
         if description:
             description = self.clean_html_content(description)
         
-        # Build simple content summary
-        content_lines = [
-            f"JIRA Issue: {issue_key}",
-            f"Summary: {summary}",
-            f"Type: {issue_type}",
-            f"Status: {status}",
-            f"Priority: {priority}",
-            f"Assignee: {assignee}",
-            f"Project: {project_name}",
-            f"",
+        # Build simple content summary in one pass
+        content = (
+            f"JIRA Issue: {issue_key}\n"
+            f"Summary: {summary}\n"
+            f"Type: {issue_type}\n"
+            f"Status: {status}\n"
+            f"Priority: {priority}\n"
+            f"Assignee: {assignee}\n"
+            f"Project: {project_name}\n"
+            f"\n"
             f"Description: {description}"
-        ]
+        )
         
         # Add subtasks if available
         if subtasks:
-            content_lines.append("")
-            content_lines.append("Subtasks:")
-            for subtask in subtasks:
-                subtask_fields = subtask.get("fields", {})
-                subtask_key = subtask.get("key", "Unknown")
-                subtask_summary = subtask_fields.get("summary", "No summary")
-                subtask_status = subtask_fields.get("status", {}).get("name", "Unknown")
-                content_lines.append(f"- {subtask_key}: {subtask_summary} ({subtask_status})")
+            content += "\n\nSubtasks:\n" + "\n".join(
+                f"- {subtask.get('key', 'Unknown')}: "
+                f"{subtask.get('fields', {}).get('summary', 'No summary')} "
+                f"({subtask.get('fields', {}).get('status', {}).get('name', 'Unknown')})"
+                for subtask in subtasks
+            )
         
         # Create filename
-        safe_summary = re.sub(r'[^\w\s-]', '', summary).strip()
-        safe_summary = re.sub(r'[-\s]+', '-', safe_summary)
-        filename = f"jira-{issue_key}-{safe_summary}.txt"
+        filename = f"jira-{issue_key}-{_safe_name(summary)}.txt"
         
         # Create JSON content for database storage (simplified format)
         json_content = {
             "page_id": issue_key,  # Using issue_key as page_id for consistency
             "title": summary,
-            "content": "\n".join(content_lines),
+            "content": content,
             "url": f"{self.base_url}/browse/{issue_key}",
             "source": "jira"
         }
         
         return {
             "title": f"{issue_key}: {summary}",
-            "content": "\n".join(content_lines),
+            "content": content,
             "filename": filename,
             "issue_key": issue_key,
             "project_name": project_name,
@@ -149,72 +374,144 @@ class JiraService:
         if not html_content:
             return ""
         
-        # Simple HTML tag removal
-        import re
         # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', html_content)
+        clean_text = _HTML_TAG_RE.sub('', html_content)
         # Decode HTML entities
-        clean_text = clean_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+        clean_text = html.unescape(clean_text)
         # Clean up whitespace
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
         
         return clean_text
 
-    def search_issues_by_jql(self, jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
-        """Search issues using JQL"""
-        try:
-            url = f"{self.base_url}/rest/api/2/search"
-            params = {
-                "jql": jql,
-                "maxResults": max_results,
-                "expand": "changelog"
-            }
-            response = requests.get(url, auth=self.auth, params=params)
-            response.raise_for_status()
-            return response.json().get("issues", [])
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error searching issues with JQL '{jql}': {str(e)}")
+    def search_issues_by_jql(
+        self,
+        jql: str,
+        max_results: int = 50,
+        fields: Optional[str] = None,
+        expand: Optional[str] = "changelog"
+    ) -> List[Dict[str, Any]]:
+        """
+        Search issues using JQL, paging until max_results issues are read.
+        fields limits the issue fields returned (default: all of them).
+        """
+        issues = []
+        for page in self.iter_issues_by_jql(
+            jql,
+            page_size=min(max_results, SEARCH_PAGE_SIZE),
+            fields=fields,
+            expand=expand
+        ):
+            issues.extend(page[:max_results - len(issues)])
+            if len(issues) >= max_results:
+                break
+        return issues
+
+    def iter_issues_by_jql(
+        self, jql: str, page_size: int = SEARCH_PAGE_SIZE, **params
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the issues matching a JQL query one page at a time"""
+        url = f"{self.base_url}/rest/api/2/search"
+        # Built once; only startAt changes from page to page
+        params.update(jql=jql, maxResults=page_size)
+        start_at = 0
+        while True:
+            params["startAt"] = start_at
+            try:
+                response = self.session.get(url, params=params)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Error searching issues with JQL '{jql}': {str(e)}")
+            
+            data = _json(response)
+            issues = data.get("issues", [])
+            if not issues:
+                return
+            
+            # Advance by what the server returned, it may cap the page size
+            # (JIRA Cloud serves at most 100 per page)
+            yield issues
+            start_at += len(issues)
+            if start_at >= data.get("total", 0):
+                return
 
     def fetch_all_project_issues(self, project_key: str, max_results: int = 1000) -> List[Dict[str, Any]]:
-        """Fetch all issues from a project"""
+        """Fetch all issues from a project, up to max_results, page by page"""
         try:
-            url = f"{self.base_url}/rest/api/2/search"
-            params = {
-                "jql": f"project = {project_key}",
-                "maxResults": max_results,
-                "expand": "changelog,subtasks"
-            }
-            response = requests.get(url, auth=self.auth, params=params)
-            response.raise_for_status()
-            return response.json().get("issues", [])
-        except requests.exceptions.RequestException as e:
+            return self.search_issues_by_jql(
+                f"project = {project_key}",
+                max_results,
+                fields=ISSUE_STORAGE_FIELDS,
+                expand=None
+            )
+        except Exception as e:
             raise Exception(f"Error fetching all issues for project '{project_key}': {str(e)}")
 
     def fetch_project_issues_by_type(self, project_key: str, issue_type: str, max_results: int = 500) -> List[Dict[str, Any]]:
-        """Fetch issues of specific type from a project"""
+        """Fetch issues of specific type from a project, page by page"""
         try:
-            url = f"{self.base_url}/rest/api/2/search"
-            params = {
-                "jql": f"project = {project_key} AND issuetype = '{issue_type}'",
-                "maxResults": max_results,
-                "expand": "changelog,subtasks"
-            }
-            response = requests.get(url, auth=self.auth, params=params)
-            response.raise_for_status()
-            return response.json().get("issues", [])
-        except requests.exceptions.RequestException as e:
+            return self.search_issues_by_jql(
+                f"project = {project_key} AND issuetype = '{issue_type}'",
+                max_results,
+                fields=ISSUE_STORAGE_FIELDS,
+                expand=None
+            )
+        except Exception as e:
             raise Exception(f"Error fetching {issue_type} issues for project '{project_key}': {str(e)}")
 
+    @cached(_PROJECT_CACHE, key=_issue_cache_key, lock=threading.Lock())
     def get_project_info(self, project_key: str) -> Dict[str, Any]:
-        """Get project information"""
+        """Get project information, served from memory for five minutes"""
         try:
             url = f"{self.base_url}/rest/api/2/project/{project_key}"
-            response = requests.get(url, auth=self.auth)
+            response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return _json(response)
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching project info for '{project_key}': {str(e)}")
 
+    @staticmethod
+    def _issue_type_bucket(issue: Dict[str, Any]) -> str:
+        """Group name used by the project summaries for an issue's type"""
+        # Direct subscripts avoid building throwaway defaults per issue;
+        # issues missing a type land in "other"
+        try:
+            issue_type = issue["fields"]["issuetype"]["name"].lower()
+        except (KeyError, TypeError, AttributeError):
+            return "other"
+        return ISSUE_TYPE_GROUPS.get(issue_type, "other")
+
+    def summarize_project_issues(self, project_key: str) -> Dict[str, Any]:
+        """
+        Issue counts, keys and summaries per type for a project. Issues are
+        streamed page by page and only key and summary are kept, so memory
+        does not grow with the size of each issue.
+        """
+        try:
+            project_info = self.get_project_info(project_key)
+            
+            issues_by_type_data = {group: [] for group in ISSUE_TYPE_GROUP_NAMES}
+            total_issues = 0
+            for page in self.iter_issues_by_jql(
+                f"project = {project_key}", fields="summary,issuetype"
+            ):
+                total_issues += len(page)
+                for issue in page:
+                    issues_by_type_data[self._issue_type_bucket(issue)].append({
+                        "key": issue.get("key"),
+                        "summary": issue.get("fields", {}).get("summary")
+                    })
+            
+            return {
+                "project_key": project_key,
+                "project_name": project_info.get("name", project_key),
+                "total_issues": total_issues,
+                "issues_by_type": {k: len(v) for k, v in issues_by_type_data.items()},
+                "issues_by_type_data": issues_by_type_data
+            }
+            
+        except Exception as e:
+            raise Exception(f"Error processing project issues: {str(e)}")
+
     def process_project_issues(self, project_key: str, bucket: str = "jira-project-docs") -> Dict[str, Any]:
         """Process all issues from a project and return summary"""
         try:
@@ -222,34 +519,18 @@ class JiraService:
             project_info = self.get_project_info(project_key)
             project_name = project_info.get("name", project_key)
             
-            # Fetch all issues
-            all_issues = self.fetch_all_project_issues(project_key)
+            # Fetch all issues, page by page
+            all_issues = []
+            for page in self.iter_issues_by_jql(
+                f"project = {project_key}", fields=ISSUE_STORAGE_FIELDS
+            ):
+                all_issues.extend(page)
             
             # Organize issues by type
-            issues_by_type = {
-                "epics": [],
-                "stories": [],
-                "tasks": [],
-                "subtasks": [],
-                "bugs": [],
-                "other": []
-            }
-            
+            issues_by_type = {group: [] for group in ISSUE_TYPE_GROUP_NAMES}
+            issue_type_bucket = self._issue_type_bucket
             for issue in all_issues:
-                issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "").lower()
-                
-                if issue_type == "epic":
-                    issues_by_type["epics"].append(issue)
-                elif issue_type == "story":
-                    issues_by_type["stories"].append(issue)
-                elif issue_type == "task":
-                    issues_by_type["tasks"].append(issue)
-                elif issue_type == "sub-task":
-                    issues_by_type["subtasks"].append(issue)
-                elif issue_type == "bug":
-                    issues_by_type["bugs"].append(issue)
-                else:
-                    issues_by_type["other"].append(issue)
+                issues_by_type[issue_type_bucket(issue)].append(issue)
             
             return {
                 "project_key": project_key,
@@ -297,46 +578,36 @@ class JiraService:
         if include_subtasks:
             subtasks = self.fetch_issue_subtasks(issue_key)
         
-        # Build content
-        content_lines = [
-            f"# JIRA Issue: {issue_key}",
-            f"",
-            f"**Summary:** {summary}",
-            f"**Type:** {issue_type}",
-            f"**Status:** {status}",
-            f"**Priority:** {priority}",
-            f"**Assignee:** {assignee}",
-            f"**Reporter:** {reporter}",
-            f"**Project:** {project_name} ({project_key})",
-            f"**Epic:** {epic_name}",
-            f"**Created:** {created}",
-            f"**Updated:** {updated}",
-            f"",
-            f"## Description",
-            f"{description}",
-            f""
-        ]
+        # Build content in one pass
+        text = (
+            f"# JIRA Issue: {issue_key}\n"
+            f"\n"
+            f"**Summary:** {summary}\n"
+            f"**Type:** {issue_type}\n"
+            f"**Status:** {status}\n"
+            f"**Priority:** {priority}\n"
+            f"**Assignee:** {assignee}\n"
+            f"**Reporter:** {reporter}\n"
+            f"**Project:** {project_name} ({project_key})\n"
+            f"**Epic:** {epic_name}\n"
+            f"**Created:** {created}\n"
+            f"**Updated:** {updated}\n"
+            f"\n"
+            f"## Description\n"
+            f"{description}\n"
+        )
         
         # Add subtasks if available
         if subtasks:
-            content_lines.extend([
-                f"## Subtasks",
-                f""
-            ])
-            for subtask in subtasks:
-                subtask_fields = subtask.get("fields", {})
-                subtask_key = subtask.get("key", "Unknown")
-                subtask_summary = subtask_fields.get("summary", "No summary")
-                subtask_status = subtask_fields.get("status", {}).get("name", "Unknown")
-                content_lines.extend([
-                    f"- **{subtask_key}:** {subtask_summary} ({subtask_status})"
-                ])
-            content_lines.append("")
+            text += "## Subtasks\n\n" + "".join(
+                f"- **{subtask.get('key', 'Unknown')}:** "
+                f"{subtask.get('fields', {}).get('summary', 'No summary')} "
+                f"({subtask.get('fields', {}).get('status', {}).get('name', 'Unknown')})\n"
+                for subtask in subtasks
+            )
         
         # Create filename
-        safe_summary = re.sub(r'[^\w\s-]', '', summary).strip()
-        safe_summary = re.sub(r'[-\s]+', '-', safe_summary)
-        filename = f"jira-{issue_key}-{safe_summary}.txt"
+        filename = f"jira-{issue_key}-{_safe_name(summary)}.txt"
         
         # Create JSON content for database storage
         content = {
@@ -365,7 +636,7 @@ class JiraService:
         
         return {
             "title": f"{issue_key}: {summary}",
-            "content": "\n".join(content_lines),
+            "content": text,
             "filename": filename,
             "issue_key": issue_key,
             "project_name": project_name,
@@ -380,49 +651,56 @@ class JiraService:
         try:
             # Get all issues for the project
             jql = f"project = {project_key}"
-            issues = self.search_issues_by_jql(jql, max_results=1000)
+            # Only the keys are used here, details are fetched per issue
+            issues = self.search_issues_by_jql(
+                jql, max_results=1000, fields="key", expand=None
+            )
             
-            all_issues_data = []
             total_issues = len(issues)
+            issue_keys = [issue.get('key') for issue in issues if issue.get('key')]
             
-            for i, issue in enumerate(issues):
-                print(f"Processing issue {i+1}/{total_issues}: {issue.get('key', 'Unknown')}")
-                
-                # Get detailed issue information
-                issue_key = issue.get('key')
-                if not issue_key:
-                    continue
-                
-                detailed_issue = self.fetch_issue_by_key(issue_key)
-                if not detailed_issue:
-                    continue
-                
-                # Get subtasks
-                subtasks = self.fetch_issue_subtasks(issue_key)
-                
-                # Get comments
-                comments = self.fetch_issue_comments(issue_key)
-                
-                # Format issue content
-                issue_data = {
-                    "issue": detailed_issue,
-                    "subtasks": subtasks,
-                    "comments": comments,
-                    "issue_key": issue_key
-                }
-                
-                all_issues_data.append(issue_data)
+            # Issue details and comments are independent requests; queue all
+            # of them up front so the pool never idles behind one issue's
+            # slowest call. Subtasks come from a few batched searches.
+            with ThreadPoolExecutor(
+                max_workers=get_settings().JIRA_MAX_CONCURRENCY
+            ) as executor:
+                subtasks_by_parent = executor.submit(
+                    self.fetch_subtasks_for_issues, issue_keys
+                )
+                fetches = [
+                    (
+                        issue_key,
+                        executor.submit(self.fetch_issue_by_key, issue_key),
+                        executor.submit(self.fetch_issue_comments, issue_key)
+                    )
+                    for issue_key in issue_keys
+                ]
+                subtasks_by_parent = subtasks_by_parent.result()
+                all_issues_data = [
+                    {
+                        "issue": issue.result(),
+                        "subtasks": subtasks_by_parent.get(issue_key, []),
+                        "comments": comments.result(),
+                        "issue_key": issue_key
+                    }
+                    for issue_key, issue, comments in fetches
+                ]
+            
+            # One timestamp for the header, filename and JSON content
+            import_timestamp = self._get_current_timestamp()
             
             # Create comprehensive content
             content_lines = [
                 f"# JIRA Board Import: {project_key}",
                 f"Total Issues: {total_issues}",
-                f"Import Date: {self._get_current_timestamp()}",
+                f"Import Date: {import_timestamp}",
                 "",
                 "---",
                 ""
             ]
             
+            board_issues = []
             for issue_data in all_issues_data:
                 issue = issue_data["issue"]
                 issue_key = issue_data["issue_key"]
@@ -434,17 +712,17 @@ class JiraService:
                 status = issue.get("fields", {}).get("status", {}).get("name", "Unknown")
                 issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "Unknown")
                 
-                content_lines.extend([
+                issue_lines = [
                     f"## {issue_key}: {summary}",
                     f"**Type:** {issue_type} | **Status:** {status}",
                     ""
-                ])
+                ]
                 
                 # Add issue description
                 description = issue.get("fields", {}).get("description", "")
                 if description:
                     clean_description = self.clean_html_content(str(description))
-                    content_lines.extend([
+                    issue_lines.extend([
                         "### Description:",
                         clean_description,
                         ""
@@ -452,7 +730,7 @@ class JiraService:
                 
                 # Add subtasks
                 if subtasks:
-                    content_lines.extend([
+                    issue_lines.extend([
                         "### Subtasks:",
                         ""
                     ])
@@ -460,14 +738,14 @@ class JiraService:
                         subtask_key = subtask.get("key", "Unknown")
                         subtask_summary = subtask.get("fields", {}).get("summary", "No Summary")
                         subtask_status = subtask.get("fields", {}).get("status", {}).get("name", "Unknown")
-                        content_lines.extend([
+                        issue_lines.extend([
                             f"- **{subtask_key}:** {subtask_summary} ({subtask_status})"
                         ])
-                    content_lines.append("")
+                    issue_lines.append("")
                 
                 # Add comments
                 if comments:
-                    content_lines.extend([
+                    issue_lines.extend([
                         "### Comments:",
                         ""
                     ])
@@ -476,24 +754,34 @@ class JiraService:
                         created = comment.get("created", "Unknown Date")
                         body = comment.get("body", "")
                         clean_body = self.clean_html_content(str(body))
-                        content_lines.extend([
+                        issue_lines.extend([
                             f"**{author}** ({created}):",
                             clean_body,
                             ""
                         ])
                 
+                content_lines.extend(issue_lines)
                 content_lines.extend(["---", ""])
+                
+                # Each issue is also stored as its own document
+                board_issues.append({
+                    "issue_key": issue_key,
+                    "title": f"{issue_key}: {summary}",
+                    "content": "\n".join(issue_lines),
+                    "filename": f"jira-{issue_key}-{_safe_name(summary)}.txt",
+                    "url": f"{self.base_url}/browse/{issue_key}"
+                })
             
             # Create filename
-            safe_project = re.sub(r'[^\w\s-]', '', project_key).strip()
-            filename = f"jira-board-{safe_project}-{self._get_current_timestamp()}.txt"
+            safe_project = _UNSAFE_CHARS_RE.sub('', project_key).strip()
+            filename = f"jira-board-{safe_project}-{import_timestamp}.txt"
             
             # Create JSON content for database
             json_content = {
                 "project_key": project_key,
                 "board_id": board_id,
                 "total_issues": total_issues,
-                "import_timestamp": self._get_current_timestamp(),
+                "import_timestamp": import_timestamp,
                 "issues": all_issues_data,
                 "url": f"{self.base_url}/jira/software/projects/{project_key}/boards/{board_id}" if board_id else f"{self.base_url}/browse/{project_key}"
             }
@@ -505,6 +793,7 @@ class JiraService:
                 "project_key": project_key,
                 "board_id": board_id,
                 "total_issues": total_issues,
+                "issues": board_issues,
                 "json_content": json_content
             }
             
@@ -515,10 +804,10 @@ class JiraService:
         """Fetch comments for a specific issue"""
         try:
             url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-            response = requests.get(url, auth=self.auth, headers={"Accept": "application/json"})
+            response = self.session.get(url)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 return data.get("comments", [])
             else:
                 print(f"Failed to fetch comments for {issue_key}: {response.status_code}")
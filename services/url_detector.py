@@ -14,6 +14,14 @@ class SourceType(str, Enum):
     UNKNOWN = "unknown"
 
 
+_PAGE_ID_PARAM_RE = re.compile(r'pageId=(\d+)')
+_PAGE_ID_PATH_RE = re.compile(r'/pages/(\d+)/')
+_BROWSE_KEY_RE = re.compile(r'/browse/([A-Z]+-\d+)')
+_ISSUES_KEY_RE = re.compile(r'/issues/([A-Z]+-\d+)')
+_BOARD_RE = re.compile(r'/jira/software/projects/([^/]+)/boards/(\d+)')
+_RAPID_VIEW_RE = re.compile(r'rapidView=(\d+)')
+
+
 class URLDetector:
     """Service for detecting and parsing Confluence and JIRA URLs"""
     
@@ -40,15 +48,10 @@ class URLDetector:
         if not url or not isinstance(url, str):
             return SourceType.UNKNOWN
         
-        # Check Confluence patterns
-        for pattern in cls.CONFLUENCE_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return SourceType.CONFLUENCE
-        
-        # Check JIRA patterns
-        for pattern in cls.JIRA_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return SourceType.JIRA
+        # Check Confluence patterns anywhere in the URL before JIRA ones
+        for source_type, pattern in _SOURCE_TYPE_RES:
+            if pattern.search(url):
+                return source_type
         
         return SourceType.UNKNOWN
     
@@ -57,14 +60,17 @@ class URLDetector:
         """Extract Confluence page ID from URL"""
         if cls.detect_source_type(url) != SourceType.CONFLUENCE:
             return None
-        
+        return cls._confluence_page_id(url)
+    
+    @staticmethod
+    def _confluence_page_id(url: str) -> Optional[str]:
         # Pattern 1: /pages/viewpage.action?pageId=123456
-        page_id_match = re.search(r'pageId=(\d+)', url)
+        page_id_match = _PAGE_ID_PARAM_RE.search(url)
         if page_id_match:
             return page_id_match.group(1)
         
         # Pattern 2: /pages/123456/Page+Title
-        pages_match = re.search(r'/pages/(\d+)/', url)
+        pages_match = _PAGE_ID_PATH_RE.search(url)
         if pages_match:
             return pages_match.group(1)
         
@@ -75,14 +81,17 @@ class URLDetector:
         """Extract JIRA issue key from URL"""
         if cls.detect_source_type(url) != SourceType.JIRA:
             return None
-        
+        return cls._jira_issue_key(url)
+    
+    @staticmethod
+    def _jira_issue_key(url: str) -> Optional[str]:
         # Pattern 1: /browse/PROJECT-123
-        browse_match = re.search(r'/browse/([A-Z]+-\d+)', url)
+        browse_match = _BROWSE_KEY_RE.search(url)
         if browse_match:
             return browse_match.group(1)
         
         # Pattern 2: /issues/PROJECT-123
-        issues_match = re.search(r'/issues/([A-Z]+-\d+)', url)
+        issues_match = _ISSUES_KEY_RE.search(url)
         if issues_match:
             return issues_match.group(1)
         
@@ -93,9 +102,12 @@ class URLDetector:
         """Extract JIRA board information from URL"""
         if cls.detect_source_type(url) != SourceType.JIRA:
             return None
-        
+        return cls._jira_board_info(url)
+    
+    @staticmethod
+    def _jira_board_info(url: str) -> Optional[Dict[str, str]]:
         # Pattern: /jira/software/projects/PROJECT/boards/123
-        board_match = re.search(r'/jira/software/projects/([^/]+)/boards/(\d+)', url)
+        board_match = _BOARD_RE.search(url)
         if board_match:
             return {
                 "project_key": board_match.group(1),
@@ -103,7 +115,7 @@ class URLDetector:
             }
         
         # Pattern: /secure/RapidBoard.jspa?rapidView=123
-        rapid_view_match = re.search(r'rapidView=(\d+)', url)
+        rapid_view_match = _RAPID_VIEW_RE.search(url)
         if rapid_view_match:
             return {
                 "rapid_view_id": rapid_view_match.group(1)
@@ -133,16 +145,18 @@ class URLDetector:
         except Exception:
             pass
         
+        # The source type is already known, so skip the checks
+        # the public extract_* helpers repeat
         if source_type == SourceType.CONFLUENCE:
-            result["identifier"] = cls.extract_confluence_page_id(url)
+            result["identifier"] = cls._confluence_page_id(url)
         elif source_type == SourceType.JIRA:
             # Check if it's a board URL first
-            board_info = cls.extract_jira_board_info(url)
+            board_info = cls._jira_board_info(url)
             if board_info:
                 result["identifier"] = board_info
                 result["url_type"] = "board"
             else:
-                result["identifier"] = cls.extract_jira_issue_key(url)
+                result["identifier"] = cls._jira_issue_key(url)
                 result["url_type"] = "issue"
         
         return result
@@ -151,3 +165,16 @@ class URLDetector:
     def validate_url(cls, url: str) -> bool:
         """Validate if URL is a supported Confluence or JIRA URL"""
         return cls.detect_source_type(url) != SourceType.UNKNOWN
+
+
+# One compiled alternation per source type, in the order they are checked
+_SOURCE_TYPE_RES = (
+    (
+        SourceType.CONFLUENCE,
+        re.compile("|".join(URLDetector.CONFLUENCE_PATTERNS), re.IGNORECASE),
+    ),
+    (
+        SourceType.JIRA,
+        re.compile("|".join(URLDetector.JIRA_PATTERNS), re.IGNORECASE),
+    ),
+)